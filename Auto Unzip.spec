@@ -5,7 +5,7 @@ a = Analysis(
     ['Auto_unzip.py'],
     pathex=[],
     binaries=[],
-    datas=[('app_icon.png', '.')],
+    datas=[('app_icon.png', '.'), ('locales', 'locales')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
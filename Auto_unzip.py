@@ -1,17 +1,49 @@
 import os
 import sys
 import time
+import sqlite3
 import shutil
 import zipfile
 import logging
 import subprocess
 import hashlib
+import json
+import zlib
+import urllib.parse
+import io
+import glob
+import argparse
+import struct
+import select
+import signal
+import platform
+import secrets
+import tempfile
+import asyncio
+import heapq
+import bisect
+import itertools
+import threading
+from functools import partial, lru_cache
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+import multiprocessing
+from multiprocessing.connection import Listener, Client, AuthenticationError
 from pathlib import Path
 
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import (
+    FileSystemEventHandler,
+    FileCreatedEvent,
+    FileDeletedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+)
 
-from win11toast import toast  # notifications Win11 + boutons
+try:
+    from win11toast import toast  # notifications Win11 + boutons
+except ImportError:
+    toast = None  # headless use (batch CLI, non-Windows hosts)
 
 from translations import get_translator, set_global_language, show_language_selection_dialog, t
 
@@ -27,6 +59,16 @@ try:
 except ImportError:
     winreg = None
 
+try:
+    import msvcrt  # Windows only (file handles for sparse files)
+except ImportError:
+    msvcrt = None
+
+try:
+    import fcntl  # POSIX only (single-instance lock)
+except ImportError:
+    fcntl = None
+
 import ctypes
 from ctypes import wintypes
 
@@ -36,6 +78,8 @@ from ctypes import wintypes
 
 APP_NAME = "Auto Unzip"
 
+IS_WINDOWS = os.name == "nt"
+
 DOWNLOADS = Path.home() / "Downloads"
 
 # Installation configuration (can be customized by setup window)
@@ -47,6 +91,8 @@ INCOMPLETE_EXTS = {".crdownload", ".part"}  # Only common Chrome/Firefox downloa
 # Installation directory (using Windows API for security)
 def _get_local_appdata() -> Path:
     """Get LOCALAPPDATA using Windows API (more secure than env vars)"""
+    if not IS_WINDOWS:
+        return Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share")
     try:
         path = ctypes.create_unicode_buffer(wintypes.MAX_PATH)
         hresult = ctypes.windll.shell32.SHGetFolderPathW(None, 0x001C, None, 0, path)
@@ -58,6 +104,8 @@ def _get_local_appdata() -> Path:
 
 def _get_appdata() -> Path:
     """Get APPDATA using Windows API"""
+    if not IS_WINDOWS:
+        return Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config")
     try:
         path = ctypes.create_unicode_buffer(wintypes.MAX_PATH)
         hresult = ctypes.windll.shell32.SHGetFolderPathW(None, 0x0003, None, 0, path)
@@ -74,6 +122,9 @@ RUN_KEY_PATH = r"Software\Microsoft\Windows\CurrentVersion\Run"
 
 # Monitoring folder (customizable during setup)
 MONITOR_FOLDER = DOWNLOADS
+# "native" (OS notifications), "polling" (scandir snapshots, for SMB/cloud-sync folders)
+# or "auto" (polling on network drives, native otherwise)
+MONITOR_MODE = "auto"
 
 LOG_DIR = INSTALL_DIR
 try:
@@ -98,20 +149,43 @@ START_MENU_UNINSTALL_SHORTCUT = START_MENU_DIR / f"Uninstall {APP_NAME}.lnk"
 # Single instance + shutdown for update/uninstall
 MUTEX_NAME = r"Global\Auto Unzip_SingleInstance"
 SHUTDOWN_EVENT_NAME = r"Global\Auto Unzip_Shutdown"
+# POSIX equivalent of the mutex: flock'ed file holding the watcher's PID
+INSTANCE_LOCK_FILE = INSTALL_DIR / "instance.lock"
 
 # Installation configuration storage
 SETUP_CONFIG_FILE = _get_local_appdata() / APP_NAME / "setup_config.json"
 
+# Extraction manifests (one JSON-lines file per extraction, used for verify/undo)
+WRITE_MANIFEST = True
+MANIFEST_DIR = INSTALL_DIR / "manifests"
+MANIFEST_VERSION = 1
+# Manifests are pruned at startup after this long, or once their destination folder is gone
+MANIFEST_RETENTION = 30 * 24 * 3600
+
+# Checkpoints of completed members, so an interrupted extraction resumes after restart
+CHECKPOINT_DIR = INSTALL_DIR / "checkpoints"
+# The batch CLI keeps its own: the watcher must never resume (and then delete) its archives
+BATCH_CHECKPOINT_DIR = INSTALL_DIR / "batch_checkpoints"
+
+# Download speed/stall statistics per source, used to tune readiness waits
+READINESS_STATS_FILE = INSTALL_DIR / "readiness_stats.json"
+
+# Append-only log of job state transitions, replayed on startup after a crash
+JOURNAL_FILE = INSTALL_DIR / "jobs.db"
+
 # =========================
 # Security: Log File Permissions
 # =========================
 
-def _set_log_file_permissions():
-    """Set restrictive ACL on log file using Windows icacls to prevent information disclosure"""
+def _restrict_file_permissions(path: Path):
+    """Set restrictive ACL (current user only) using Windows icacls, or mode 600 elsewhere"""
+    if not IS_WINDOWS:
+        os.chmod(path, 0o600)
+        return
     try:
         username = os.getenv('USERNAME', 'Owner')
         subprocess.run(
-            ["icacls", str(LOG_FILE), "/inheritance:r", "/grant:r", f"{username}:F"],
+            ["icacls", str(path), "/inheritance:r", "/grant:r", f"{username}:F"],
             capture_output=True,
             check=False,
             timeout=5
@@ -119,6 +193,10 @@ def _set_log_file_permissions():
     except Exception:
         pass
 
+def _set_log_file_permissions():
+    """Set restrictive ACL on log file to prevent information disclosure"""
+    _restrict_file_permissions(LOG_FILE)
+
 # =========================
 # Logging
 # =========================
@@ -151,7 +229,7 @@ log_startup()
 # Win32 helpers (mutex + event)
 # =========================
 
-kernel32 = ctypes.windll.kernel32
+kernel32 = ctypes.windll.kernel32 if hasattr(ctypes, "windll") else None
 WAIT_OBJECT_0 = 0x00000000
 
 def _win_create_mutex(name: str):
@@ -181,10 +259,92 @@ def _win_set_event(h):
 def _win_wait_for_single_object(h, timeout_ms: int) -> int:
     return kernel32.WaitForSingleObject(h, timeout_ms)
 
+# =========================
+# Platform layer: single instance + shutdown signal
+# =========================
+
+_instance_lock_file = None
+
+def _posix_acquire_instance_lock() -> bool:
+    global _instance_lock_file
+    INSTALL_DIR.mkdir(parents=True, exist_ok=True)
+    f = open(INSTANCE_LOCK_FILE, "a+", encoding="utf-8")
+    try:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        f.close()
+        return False
+    f.seek(0)
+    f.truncate()
+    f.write(str(os.getpid()))
+    f.flush()
+    # Kept open for the lifetime of the process: the kernel drops the lock if we crash
+    _instance_lock_file = f
+    return True
+
+def _posix_running_instance_pid():
+    """PID of the watcher holding the instance lock, or None"""
+    try:
+        with open(INSTANCE_LOCK_FILE, "r", encoding="utf-8") as f:
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_SH | fcntl.LOCK_NB)
+                return None  # nobody holds it
+            except OSError:
+                pass
+            pid = int(f.read().strip() or 0)
+            return pid if pid > 0 else None
+    except (OSError, ValueError):
+        return None
+
+class _WindowsShutdownSignal:
+    """Named event set by request_running_instance_shutdown() from another process"""
+
+    def __init__(self):
+        self.handle = _win_create_event(SHUTDOWN_EVENT_NAME)
+
+    def wait(self, timeout: float) -> bool:
+        return _win_wait_for_single_object(self.handle, int(timeout * 1000)) == WAIT_OBJECT_0
+
+class _PosixShutdownSignal:
+    """
+    SIGTERM/SIGINT/SIGHUP (sent by request_running_instance_shutdown() from another process).
+    Self-pipe: the handler only writes a byte, wait() sleeps in select() with no polling.
+    """
+
+    def __init__(self):
+        self.requested = False
+        self._r, self._w = os.pipe()
+        os.set_blocking(self._w, False)
+        for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+            try:
+                signal.signal(sig, self._on_signal)
+            except (ValueError, OSError):
+                pass  # not on the main thread
+
+    def _on_signal(self, signum, frame):
+        self.requested = True
+        try:
+            os.write(self._w, b"\0")
+        except OSError:
+            pass
+
+    def wait(self, timeout: float) -> bool:
+        if not self.requested:
+            try:
+                select.select([self._r], [], [], timeout)
+            except InterruptedError:
+                pass
+        return self.requested
+
 def ensure_single_instance_or_exit():
     """
     Empêche 2 watchers actifs. À appeler UNIQUEMENT pour l'instance installée (watcher).
     """
+    if not IS_WINDOWS:
+        if not _posix_acquire_instance_lock():
+            logging.info("Another instance is already running")
+            sys.exit(0)
+        return
     _ = _win_create_mutex(MUTEX_NAME)
     ERROR_ALREADY_EXISTS = 183
     if _win_get_last_error() == ERROR_ALREADY_EXISTS:
@@ -196,12 +356,21 @@ def ensure_single_instance_or_exit():
         sys.exit(0)
 
 def create_shutdown_event():
-    return _win_create_event(SHUTDOWN_EVENT_NAME)
+    """Shutdown signal of this process: wait(timeout) returns True once shutdown is requested"""
+    return _WindowsShutdownSignal() if IS_WINDOWS else _PosixShutdownSignal()
 
 def request_running_instance_shutdown():
     """
     Demande à l'ancienne instance (installée) de s'arrêter (update/uninstall).
     """
+    if not IS_WINDOWS:
+        pid = _posix_running_instance_pid()
+        if pid and pid != os.getpid():
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError as e:
+                logging.warning("Could not signal running instance: %s", e)
+        return
     h = _win_open_event(SHUTDOWN_EVENT_NAME)
     if not h:
         return
@@ -210,8 +379,11 @@ def request_running_instance_shutdown():
 def wait_until_unlocked(path: Path, timeout_sec: int = 10) -> bool:
     """
     Wait until file is unlocked (not being written to).
+    Windows has no "handle closed" notification, so poll with exponential backoff:
+    short locks are detected within tens of ms, long ones cost few wakeups.
     """
     deadline = time.time() + timeout_sec
+    delay = 0.02
     while time.time() < deadline:
         if not path.exists():
             return True
@@ -222,7 +394,8 @@ def wait_until_unlocked(path: Path, timeout_sec: int = 10) -> bool:
                 pass
             return True
         except (PermissionError, FileNotFoundError, OSError):
-            time.sleep(0.3)
+            time.sleep(min(delay, max(0.0, deadline - time.time())))
+            delay = min(delay * 2, 0.3)
     
     return False
 
@@ -298,6 +471,8 @@ def _file_uri(p: Path) -> str:
     return "file:///" + str(p).replace("\\", "/")
 
 def notify_info(title: str, message: str):
+    if toast is None:
+        return
     ensure_installed_icon()
     try:
         toast(title, message, icon=str(INSTALLED_ICON_PNG), duration="short")
@@ -305,6 +480,8 @@ def notify_info(title: str, message: str):
         pass
 
 def notify_success_extract(zip_name: str):
+    if toast is None:
+        return
     ensure_installed_icon()
     folder_uri = _file_uri(DOWNLOADS)
     buttons = [
@@ -323,6 +500,8 @@ def notify_success_extract(zip_name: str):
         pass
 
 def notify_error(title: str, message: str):
+    if toast is None:
+        return
     ensure_installed_icon()
     # SECURITY: Don't include file paths in notifications
     # Other processes can monitor toast notifications and extract path info
@@ -789,31 +968,408 @@ def uninstall():
 # Zip logic
 # =========================
 
-def is_zip_ready(zip_path: Path, stable_seconds=2.0, timeout=180.0) -> bool:
-    start = time.time()
-    last_size = -1
-    last_change = time.time()
+def split_archive_parts(zip_path: Path):
+    """
+    Parts of a split archive in stream order, None for a regular ZIP:
+    x.zip.001, x.zip.002, ... (one archive cut into pieces) or x.z01, x.z02, ..., x.zip
+    (PKZIP split, one "disk" per file). Only the parts present on disk are listed.
+    """
+    name = zip_path.name
+    lower = name.lower()
+    parts = []
+    if lower.endswith(".zip.001"):
+        prefix = name[:-3]
+        while True:
+            part = zip_path.with_name(f"{prefix}{len(parts) + 1:03d}")
+            if not part.exists():
+                return parts
+            parts.append(part)
+    if lower.endswith(".zip"):
+        prefix = name[:-3] + name[-3]  # keeps the case of the "z"
+        while True:
+            part = zip_path.with_name(f"{prefix}{len(parts) + 1:02d}")
+            if not part.exists():
+                break
+            parts.append(part)
+        return parts + [zip_path] if parts else None
+    return None
+
+def is_archive_name(name: str) -> bool:
+    """Names extraction starts from: x.zip, or x.zip.001 for a split archive"""
+    return name.lower().endswith((".zip", ".zip.001"))
+
+def split_part_primary(path: Path):
+    """Archive a split part belongs to (x.zip.003 -> x.zip.001, x.z02 -> x.zip), None for other files"""
+    stem, ext = os.path.splitext(path.name)
+    if len(ext) > 2 and ext[1:].isdigit() and stem.lower().endswith(".zip"):
+        return path.with_name(stem + ".001")
+    if len(ext) > 2 and ext[1] in "zZ" and ext[2:].isdigit():
+        return path.with_name(stem + ext[:2] + ("ip" if ext[1] == "z" else "IP"))
+    return None
+
+def archive_stem(zip_path: Path) -> str:
+    """Name of the extraction folder: x.zip -> x, x.zip.001 -> x"""
+    name = zip_path.name
+    if name.lower().endswith(".zip.001"):
+        return name[:-8]
+    return zip_path.stem
+
+class MultiPartFile(io.RawIOBase):
+    """
+    Read-only view of split archive parts as one seekable stream, for zipfile. Reads go
+    from the part files straight into the caller's buffer, nothing is concatenated.
+    With per_disk=True (x.z01 ... x.zip) every part is a ZIP disk and disk_starts maps
+    disk numbers to stream offsets; x.zip.NNN parts are a single disk cut into pieces.
+    """
+
+    def __init__(self, parts: list, per_disk: bool):
+        super().__init__()
+        self._files = []
+        try:
+            for part in parts:
+                self._files.append(open(part, "rb", buffering=0))
+        except BaseException:
+            self.close()
+            raise
+        sizes = [os.fstat(f.fileno()).st_size for f in self._files]
+        self._starts = list(itertools.accumulate(sizes, initial=0))
+        self.size = self._starts[-1]
+        self.disk_starts = self._starts[:-1] if per_disk else [0]
+        self._pos = 0
+
+    @classmethod
+    def open(cls, zip_path: Path, parts: list) -> "MultiPartFile":
+        return cls(parts, per_disk=not zip_path.name.lower().endswith(".001"))
+
+    def readable(self) -> bool:
+        return True
 
-    while time.time() - start < timeout:
-        if not zip_path.exists():
-            time.sleep(0.2)
-            continue
+    def seekable(self) -> bool:
+        return True
 
-        for ext in INCOMPLETE_EXTS:
-            if zip_path.with_suffix(zip_path.suffix + ext).exists():
-                time.sleep(0.5)
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self.size
+        if offset < 0:
+            raise ValueError("negative seek position")
+        self._pos = offset
+        return offset
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        done = 0
+        # zipfile expects full reads, a header may straddle two parts
+        while done < len(view) and self._pos < self.size:
+            index = bisect.bisect_right(self._starts, self._pos) - 1
+            f = self._files[index]
+            f.seek(self._pos - self._starts[index])
+            want = min(len(view) - done, self._starts[index + 1] - self._pos)
+            n = f.readinto(view[done:done + want])
+            if not n:
                 break
-        else:
-            size = zip_path.stat().st_size
-            if size != last_size:
-                last_size = size
-                last_change = time.time()
-            else:
-                if time.time() - last_change >= stable_seconds:
-                    return True
-            time.sleep(0.2)
+            done += n
+            self._pos += n
+        return done
+
+    def close(self):
+        for f in self._files:
+            f.close()
+        super().close()
+
+def _rebase_split_offsets(z: zipfile.ZipFile, stream: MultiPartFile):
+    """zipfile ignores disk numbers: turn per-disk member offsets (x.z01 ... x.zip) into stream offsets"""
+    starts = stream.disk_starts
+    if len(starts) < 2:
+        return
+    # zipfile shifted every offset by the start of the disk holding the central directory
+    shift = starts[bisect.bisect_right(starts, z.start_dir) - 1]
+    for info in z.infolist():
+        if info.volume >= len(starts):
+            raise zipfile.BadZipFile(f"Member {info.filename} is on a missing part")
+        info.header_offset += starts[info.volume] - shift
+
+# End Of Central Directory records (fixed part is 22 bytes, followed by a comment of up to 64KB)
+EOCD_SIGNATURE = b"PK\x05\x06"
+EOCD_STRUCT = struct.Struct("<4s4H2LH")
+ZIP64_LOCATOR_SIGNATURE = b"PK\x06\x07"
+ZIP64_LOCATOR_STRUCT = struct.Struct("<4sLQL")
+ZIP64_EOCD_SIGNATURE = b"PK\x06\x06"
+ZIP64_EOCD_STRUCT = struct.Struct("<4sQ2H2L4Q")
+EOCD_MAX_TAIL = EOCD_STRUCT.size + 0xFFFF
+
+def _zip64_tail_complete(tail: bytes, base: int, pos: int) -> bool:
+    loc_pos = pos - ZIP64_LOCATOR_STRUCT.size
+    if loc_pos < 0:
+        return False
+    sig, _, z64_offset, _ = ZIP64_LOCATOR_STRUCT.unpack_from(tail, loc_pos)
+    rel = z64_offset - base
+    if sig != ZIP64_LOCATOR_SIGNATURE or rel < 0 or rel + ZIP64_EOCD_STRUCT.size > loc_pos:
+        return False
+    sig, record_size, _, _, disk, cd_disk, _, _, cd_size, cd_offset = ZIP64_EOCD_STRUCT.unpack_from(tail, rel)
+    return (
+        sig == ZIP64_EOCD_SIGNATURE
+        and disk == 0 and cd_disk == 0
+        and z64_offset + 12 + record_size == base + loc_pos
+        and cd_offset + cd_size == z64_offset
+    )
+
+def _tail_status(f, size: int, disk_starts: list) -> str:
+    """
+    "ok" if the stream ends with a consistent End Of Central Directory record whose
+    central directory ends exactly where the record starts, "missing" if the record
+    belongs to the last disk of a split archive whose earlier parts are absent, "" otherwise.
+    """
+    if size < EOCD_STRUCT.size:
+        return ""
+    tail_len = min(size, EOCD_MAX_TAIL)
+    f.seek(size - tail_len)
+    tail = f.read(tail_len)
+    if len(tail) != tail_len:
+        return ""
 
-    return False
+    base = size - tail_len
+    last_disk = len(disk_starts) - 1
+    pos = tail.rfind(EOCD_SIGNATURE)
+    while pos >= 0:
+        if pos + EOCD_STRUCT.size <= len(tail):
+            _, disk, cd_disk, _, n_total, cd_size, cd_offset, comment_len = EOCD_STRUCT.unpack_from(tail, pos)
+            # The signature may also appear inside the comment: the real record's comment reaches EOF
+            if pos + EOCD_STRUCT.size + comment_len == len(tail):
+                if cd_offset == 0xFFFFFFFF or cd_size == 0xFFFFFFFF or n_total == 0xFFFF:
+                    # zipfile does not read multi-disk ZIP64 archives
+                    return "ok" if last_disk == 0 and _zip64_tail_complete(tail, base, pos) else ""
+                if disk > last_disk:
+                    return "missing"
+                if disk == last_disk and cd_disk <= disk and disk_starts[cd_disk] + cd_offset + cd_size == base + pos:
+                    return "ok"
+                return ""
+        pos = tail.rfind(EOCD_SIGNATURE, 0, pos)
+    return ""
+
+def zip_tail_complete(zip_path: Path, size: int = None) -> bool:
+    """
+    True if the archive ends with a consistent End Of Central Directory record. Costs a
+    single read of at most 64KB from the end of the file. Self-extracting archives (data
+    before the first entry) return False and fall back to the stability wait; split
+    archives are probed across all their parts.
+    """
+    return _archive_tail_status(zip_path, size) == "ok"
+
+def _archive_tail_status(zip_path: Path, size: int = None, parts: list = None) -> str:
+    try:
+        if parts:
+            with MultiPartFile.open(zip_path, parts) as f:
+                return _tail_status(f, f.size, f.disk_starts)
+        with open(zip_path, "rb") as f:
+            if size is None:
+                size = os.fstat(f.fileno()).st_size
+            return _tail_status(f, size, [0])
+    except OSError:
+        return ""
+
+def _readiness_sample(zip_path: Path):
+    """
+    One readiness observation: None (missing), ("incomplete", bytes so far) while a
+    download marker is present or split parts are missing, or (size, mtime_ns, tail_ok).
+    """
+    if not zip_path.exists():
+        return None
+    parts = split_archive_parts(zip_path)
+    pending = []
+    for part in parts or [zip_path]:
+        for ext in INCOMPLETE_EXTS:
+            sidecar = part.with_suffix(part.suffix + ext)
+            if sidecar.exists():
+                pending.append(sidecar)
+    try:
+        stats = [part.stat() for part in parts or [zip_path]]
+        if pending:
+            # The download is written to the marker files, their growth is the progress
+            return "incomplete", sum(st.st_size for st in stats) + sum(p.stat().st_size for p in pending)
+    except OSError:
+        return None
+    size = sum(st.st_size for st in stats)
+    status = _archive_tail_status(zip_path, size, parts)
+    # Split archives are only ready once every part is there: no stability fallback
+    if status == "missing" or (parts and status != "ok"):
+        return "incomplete", size
+    return size, max(st.st_mtime_ns for st in stats), status == "ok"
+
+# Readiness polling adapts to the observed write rate: a file growing at `rate` is
+# sampled about every READY_POLL_BYTES, the quiet window scales with the gaps between
+# writes, and the wait only fails after READY_IDLE_TIMEOUT without any growth
+READY_POLL_MIN = 0.2
+READY_POLL_MAX = 2.0
+READY_POLL_BYTES = 8 * 1024 * 1024
+READY_STABLE_MAX = 30.0
+READY_IDLE_TIMEOUT = 180.0
+READY_MAX_WAIT = 12 * 3600
+READINESS_MAX_SOURCES = 200
+
+def _ewma(previous, value: float, weight: float = 0.3) -> float:
+    return value if previous is None else previous + weight * (value - previous)
+
+def download_source(path: Path) -> str:
+    """
+    Host the file was downloaded from, when the browser recorded it (Zone.Identifier
+    stream on Windows, user.xdg.origin.url attribute elsewhere), else "unknown".
+    """
+    url = None
+    try:
+        if IS_WINDOWS:
+            with open(f"{path}:Zone.Identifier", "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    key, _, value = line.strip().partition("=")
+                    if key in ("HostUrl", "ReferrerUrl") and value:
+                        url = value
+                        if key == "HostUrl":
+                            break
+        elif hasattr(os, "getxattr"):
+            url = os.getxattr(path, "user.xdg.origin.url").decode("utf-8", "replace")
+    except OSError:
+        pass
+    if url:
+        host = urllib.parse.urlsplit(url).hostname
+        if host:
+            return host.lower()
+    return "unknown"
+
+class ReadinessStats:
+    """Learned write rate and gap between writes per download source, persisted as JSON"""
+
+    def __init__(self, path: Path = READINESS_STATS_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._sources = None
+
+    def _load(self):
+        if self._sources is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._sources = json.load(f)
+            except (OSError, ValueError):
+                self._sources = {}
+
+    def get(self, source: str) -> dict:
+        with self._lock:
+            self._load()
+            return dict(self._sources.get(source, {}))
+
+    def record(self, source: str, tracker: "ReadinessTracker"):
+        if tracker.rate is None and tracker.gap is None:
+            return  # nothing was observed growing
+        with self._lock:
+            self._load()
+            learned = self._sources.get(source, {})
+            if tracker.rate is not None:
+                learned["rate"] = round(_ewma(learned.get("rate"), tracker.rate), 1)
+            if tracker.gap is not None:
+                learned["gap"] = round(_ewma(learned.get("gap"), tracker.gap), 3)
+            learned["seen"] = int(time.time())
+            self._sources[source] = learned
+            if len(self._sources) > READINESS_MAX_SOURCES:
+                oldest = min(self._sources, key=lambda k: self._sources[k].get("seen", 0))
+                del self._sources[oldest]
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".tmp")
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(self._sources, f, separators=(",", ":"))
+                os.replace(tmp, self.path)
+            except OSError as e:
+                logging.debug("Could not save readiness statistics: %s", e)
+
+READINESS_STATS = ReadinessStats()
+
+class ReadinessTracker:
+    """Decides from successive samples when an archive is complete (shared by the sync and async waits)"""
+
+    def __init__(self, stable_seconds: float = 2.0, timeout: float = READY_IDLE_TIMEOUT, learned: dict = None):
+        self.stable_seconds = stable_seconds
+        self.timeout = timeout
+        learned = learned or {}
+        self.rate = learned.get("rate")  # bytes/s while growing
+        self.gap = learned.get("gap")  # seconds between observed growth
+        self.start = None
+        self.last_size = -1
+        self.last_change = 0.0
+        self.last_probe = None
+
+    def stable_window(self) -> float:
+        """Quiet time that counts as finished: longer for sources that pause between writes"""
+        if self.gap is None:
+            return self.stable_seconds
+        return min(READY_STABLE_MAX, max(self.stable_seconds, 2 * self.gap))
+
+    def poll_interval(self) -> float:
+        if not self.rate:
+            return READY_POLL_MIN
+        # Several samples per idle timeout, or a slow download could look stalled
+        ceiling = min(READY_POLL_MAX, self.timeout / 4)
+        return min(ceiling, max(READY_POLL_MIN, READY_POLL_BYTES / self.rate))
+
+    def expired(self, now: float) -> bool:
+        """No growth for `timeout`, or the overall READY_MAX_WAIT cap is reached"""
+        if self.start is None:
+            return False
+        return now - self.last_change >= self.timeout or now - self.start >= READY_MAX_WAIT
+
+    def _observe(self, size: int, now: float) -> bool:
+        """Track growth (rate, gap between writes); True if the size changed"""
+        if size == self.last_size:
+            return False
+        if 0 <= self.last_size < size:
+            elapsed = now - self.last_change
+            if elapsed > 0:
+                self.rate = _ewma(self.rate, (size - self.last_size) / elapsed)
+                self.gap = _ewma(self.gap, elapsed)
+        self.last_size = size
+        self.last_change = now
+        return True
+
+    def update(self, sample, now: float):
+        """Return (ready, seconds until the next sample)"""
+        if self.start is None:
+            self.start = self.last_change = now
+        if sample is None:
+            return False, READY_POLL_MIN
+        if sample[0] == "incomplete":
+            # Still downloading: only growth keeps the wait alive, poll at the download's pace
+            self._observe(sample[1], now)
+            return False, max(min(0.5, self.timeout / 4), self.poll_interval())
+        size, mtime_ns, tail_ok = sample
+        # Fast path: a consistent EOCD proves the archive is complete. One confirming
+        # tick (same size and mtime) guards against downloaders writing segments out of order.
+        if tail_ok:
+            if self.last_probe == (size, mtime_ns):
+                return True, 0.0
+            self.last_probe = (size, mtime_ns)
+        else:
+            self.last_probe = None
+        if self._observe(size, now):
+            return False, READY_POLL_MIN if tail_ok else self.poll_interval()
+        if now - self.last_change >= self.stable_window():
+            return True, 0.0
+        # Quiet: sample quickly so the end is confirmed without a long extra interval
+        return False, READY_POLL_MIN
+
+def is_zip_ready(zip_path: Path, stable_seconds=2.0, timeout=READY_IDLE_TIMEOUT) -> bool:
+    source = download_source(zip_path)
+    tracker = ReadinessTracker(stable_seconds, timeout, READINESS_STATS.get(source))
+    try:
+        while not tracker.expired(time.time()):
+            ready, delay = tracker.update(_readiness_sample(zip_path), time.time())
+            if ready:
+                return True
+            time.sleep(delay)
+        return False
+    finally:
+        READINESS_STATS.record(source, tracker)
 
 def is_within_directory(base: Path, target: Path) -> bool:
     try:
@@ -840,21 +1396,704 @@ MAX_FILES = 10000
 MAX_NAME_LENGTH = 260  # Windows MAX_PATH
 MAX_ZIP_FILE_SIZE = 10 * 1024 * 1024 * 1024  # 10GB - prevent processing suspiciously large ZIPs
 
-def safe_extract(zip_path: Path, dest_dir: Path) -> None:
-    """Safely extract ZIP with comprehensive security checks"""
+# Admission control: space kept free after a planned extraction, and how long a job may wait for it
+DISK_FREE_MARGIN = 512 * 1024 * 1024  # 512MB
+ADMISSION_WAIT_TIMEOUT = 600.0
+# Global write bandwidth for all extractions together (bytes/s), 0 = unlimited
+IO_BANDWIDTH_LIMIT = 0
+COPY_CHUNK_SIZE = 1024 * 1024
+# Archives up to this size are read into memory in one call and extracted from there:
+# no per-member seeks on the file, and the source handle is closed before writing starts
+IN_MEMORY_MAX_SIZE = 4 * 1024 * 1024  # 4MB, 0 = always extract from the file
+# What must be on disk before the archive (the only other copy) is deleted:
+# "none": leave it to the OS cache; "commit": fsync all extracted files and their
+# directories in one pass at the end; "per-file": fsync each file as it is closed.
+# Only applies when the archive is deleted afterwards (safe_extract(sync=True))
+DURABILITY = "commit"
+# Re-read the extracted files and compare them with the central directory before the
+# archive is deleted. Members decompressed in this run already had their CRC checked
+# by zipfile while streaming and only get a size check; resumed ones are re-read.
+VERIFY_BEFORE_DELETE = False
+VERIFY_WORKERS = 4
+VERIFY_BUFFER_SIZE = 8 * 1024 * 1024
+
+class DiskSpaceError(RuntimeError):
+    """Not enough free space on the destination volume for a planned extraction"""
+
+def _volume_of(path: Path):
+    """(device id, existing directory) for the volume that will hold path"""
+    p = path
+    while not p.exists() and p.parent != p:
+        p = p.parent
+    return p.stat().st_dev, p
+
+class DiskAdmission:
+    """
+    Admits an extraction only if its decompressed size fits on the destination volume,
+    counting space already reserved by in-flight extractions on the same volume.
+    Jobs that could fit later are deferred; jobs that can never fit are rejected.
+    Running jobs report what they have written (written()): those bytes already show
+    in the volume's free space and no longer count as reserved.
+    """
+
+    def __init__(self, margin: int = DISK_FREE_MARGIN, wait_timeout: float = ADMISSION_WAIT_TIMEOUT):
+        self.margin = margin
+        self.wait_timeout = wait_timeout
+        self._cond = threading.Condition()
+        self._reserved = {}  # st_dev -> reserved bytes
+
+    def _try_reserve(self, dev, probe: Path, size: int) -> bool:
+        usage = shutil.disk_usage(probe)
+        if size + self.margin > usage.total:
+            raise DiskSpaceError(f"Archive can never fit on destination volume ({size} bytes)")
+        if usage.free - self._reserved.get(dev, 0) - self.margin >= size:
+            self._reserved[dev] = self._reserved.get(dev, 0) + size
+            return True
+        return False
+
+    def acquire(self, dest_dir: Path, size: int):
+        """Reserve size bytes on dest_dir's volume, waiting for space if needed"""
+        dev, probe = _volume_of(dest_dir)
+        deadline = time.time() + self.wait_timeout
+        with self._cond:
+            while not self._try_reserve(dev, probe, size):
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise DiskSpaceError(f"Not enough free space for {size} bytes (waited {self.wait_timeout:.0f}s)")
+                logging.info("Extraction deferred, waiting for %d bytes of free space", size)
+                # Re-check periodically: space can also be freed outside this process
+                self._cond.wait(timeout=min(remaining, 5.0))
+        return dev
+
+    def _shrink(self, dev, size: int):
+        left = self._reserved.get(dev, 0) - size
+        if left > 0:
+            self._reserved[dev] = left
+        else:
+            self._reserved.pop(dev, None)
+
+    def written(self, dev, size: int):
+        """Part of a reservation is now on disk; nobody is woken, the free space did not grow"""
+        with self._cond:
+            self._shrink(dev, size)
+
+    def release(self, dev, size: int):
+        """Return the unwritten rest of a reservation"""
+        with self._cond:
+            self._shrink(dev, size)
+            self._cond.notify_all()
+
+class IoRateLimiter:
+    """Global write bandwidth limiter (token bucket shared by all extraction threads)"""
+
+    def __init__(self, rate: int = IO_BANDWIDTH_LIMIT, burst_seconds: float = 0.25):
+        self.rate = rate
+        self.burst_seconds = burst_seconds
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+
+    def consume(self, nbytes: int):
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._next = max(self._next, now - self.burst_seconds) + nbytes / self.rate
+            delay = self._next - now
+        if delay > 0:
+            time.sleep(delay)
+
+DISK_ADMISSION = DiskAdmission()
+IO_LIMITER = IoRateLimiter()
+
+# =========================
+# Background priority
+# =========================
+
+# "normal", or "background": extraction threads run at low CPU and idle I/O priority and
+# the global write rate drops while other programs keep the machine busy
+PRIORITY_MODE = "normal"
+BACKGROUND_NICE = 10
+BACKGROUND_BUSY_HIGH = 0.6  # CPU share used by other processes that starts throttling
+BACKGROUND_BUSY_LOW = 0.3  # ... and below which full speed resumes
+BACKGROUND_BUSY_RATE = 8 * 1024 * 1024  # bytes/s while throttled
+LOAD_SAMPLE_INTERVAL = 1.0
+
+_IOPRIO_WHO_PROCESS = 1
+_IOPRIO_IDLE = 3 << 13  # class IDLE, shifted by IOPRIO_CLASS_SHIFT
+_SYS_IOPRIO_SET = {"x86_64": 251, "aarch64": 30, "i686": 289, "armv7l": 314}
+_THREAD_MODE_BACKGROUND_BEGIN = 0x00010000
+_PRIO_DARWIN_THREAD = 3
+_PRIO_DARWIN_BG = 0x1000
+
+def apply_worker_priority():
+    """Lower the calling thread's CPU and I/O priority in background mode (no-op otherwise)"""
+    if PRIORITY_MODE != "background":
+        return
+    try:
+        if IS_WINDOWS:
+            # Background mode lowers CPU, I/O and memory priority of this thread together
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), _THREAD_MODE_BACKGROUND_BEGIN)
+        elif sys.platform.startswith("linux"):
+            # Linux applies nice values and I/O classes per thread (the TID is a "process")
+            tid = threading.get_native_id()
+            os.setpriority(os.PRIO_PROCESS, tid, BACKGROUND_NICE)
+            syscall_nr = _SYS_IOPRIO_SET.get(platform.machine())
+            if syscall_nr is not None:
+                ctypes.CDLL(None, use_errno=True).syscall(syscall_nr, _IOPRIO_WHO_PROCESS, tid, _IOPRIO_IDLE)
+        elif sys.platform == "darwin":
+            os.setpriority(_PRIO_DARWIN_THREAD, 0, _PRIO_DARWIN_BG)
+    except (OSError, AttributeError) as e:
+        logging.debug("Could not lower worker priority: %s", e)
+
+def _system_cpu_times():
+    """(busy, total) CPU seconds of the whole machine since boot, None if unavailable"""
+    try:
+        if IS_WINDOWS:
+            idle, kernel, user = wintypes.FILETIME(), wintypes.FILETIME(), wintypes.FILETIME()
+            if not kernel32.GetSystemTimes(ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user)):
+                return None
+            idle, kernel, user = ((t.dwHighDateTime << 32 | t.dwLowDateTime) / 1e7 for t in (idle, kernel, user))
+            # Kernel time includes idle time
+            return kernel + user - idle, kernel + user
+        with open("/proc/stat", "r") as f:
+            fields = [int(x) for x in f.readline().split()[1:9]]
+        hz = os.sysconf("SC_CLK_TCK")
+        total = sum(fields) / hz
+        idle = (fields[3] + fields[4]) / hz  # idle + iowait
+        return total - idle, total
+    except (OSError, ValueError, AttributeError):
+        return None
+
+class SystemLoadMonitor:
+    """
+    Background mode: samples how much CPU other processes use (machine busy time minus
+    our own) and switches the global I/O limiter between full speed and
+    BACKGROUND_BUSY_RATE, with hysteresis between the two thresholds.
+    """
+
+    def __init__(self, limiter: IoRateLimiter = IO_LIMITER, interval: float = LOAD_SAMPLE_INTERVAL):
+        self.limiter = limiter
+        self.interval = interval
+        self.busy = 0.0
+        self.throttled = False
+        self.switches = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="unzip-load", daemon=True)
+
+    def start(self):
+        if _system_cpu_times() is None:
+            logging.info("System load unavailable, background mode only lowers priorities")
+            return
+        self._thread.start()
+
+    def _run(self):
+        prev = _system_cpu_times()
+        prev_own = time.process_time()
+        while not self._stop.wait(self.interval):
+            cur = _system_cpu_times()
+            own = time.process_time()
+            if cur is None:
+                continue
+            elapsed = cur[1] - prev[1]
+            if elapsed > 0:
+                # Our own extraction must not count as "busy", or it would throttle itself
+                self.busy = max(0.0, (cur[0] - prev[0]) - (own - prev_own)) / elapsed
+                if not self.throttled and self.busy >= BACKGROUND_BUSY_HIGH:
+                    self._set_throttled(True)
+                elif self.throttled and self.busy <= BACKGROUND_BUSY_LOW:
+                    self._set_throttled(False)
+            prev, prev_own = cur, own
+
+    def _set_throttled(self, throttled: bool):
+        self.throttled = throttled
+        self.switches += 1
+        if throttled:
+            limit = BACKGROUND_BUSY_RATE if IO_BANDWIDTH_LIMIT <= 0 else min(IO_BANDWIDTH_LIMIT, BACKGROUND_BUSY_RATE)
+        else:
+            limit = IO_BANDWIDTH_LIMIT
+        self.limiter.rate = limit
+        logging.info("System %s (others use %.0f%% CPU), extraction %s", "busy" if throttled else "idle",
+                     self.busy * 100, "throttled" if throttled else "at full speed")
+
+    def stats(self) -> dict:
+        return {"busy": round(self.busy, 3), "throttled": self.throttled, "switches": self.switches, "rate": self.limiter.rate}
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=2)
+        if self.throttled:
+            self._set_throttled(False)
+
+_WINDOWS_ILLEGAL = str.maketrans(':<>|"?*', "_______")
+
+def _member_target(dest_dir: Path, member: zipfile.ZipInfo) -> Path:
+    """Output path of a member, sanitized the same way zipfile.extract() does"""
+    arcname = member.filename.replace("/", os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    parts = [x for x in arcname.split(os.path.sep) if x not in ("", os.path.curdir, os.path.pardir)]
+    if os.path.sep == "\\":
+        parts = [x.translate(_WINDOWS_ILLEGAL).rstrip(". ") for x in parts]
+        parts = [x for x in parts if x]
+    return dest_dir.joinpath(*parts) if parts else dest_dir
+
+class ExtractionCancelled(Exception):
+    """Extraction stopped on request; completed members are kept in the checkpoint"""
+
+# Large members are written as sparse files: aligned all-zero blocks of SPARSE_BLOCK
+# bytes (disk images, database dumps) are seeked over instead of written
+SPARSE_WRITES = True
+SPARSE_MIN_SIZE = 1024 * 1024
+SPARSE_BLOCK = 64 * 1024  # NTFS sparse allocation unit, a multiple of common cluster sizes
+_ZERO_BLOCK = bytes(SPARSE_BLOCK)
+FSCTL_SET_SPARSE = 0x000900C4
+
+def _set_sparse_flag(f):
+    """NTFS only leaves holes in files flagged sparse (elsewhere holes need no flag)"""
+    if not IS_WINDOWS or msvcrt is None:
+        return
+    returned = wintypes.DWORD()
+    handle = msvcrt.get_osfhandle(f.fileno())
+    if not kernel32.DeviceIoControl(wintypes.HANDLE(handle), FSCTL_SET_SPARSE, None, 0, None, 0, ctypes.byref(returned), None):
+        logging.debug("Could not mark %s sparse (file system without sparse support?)", f.name)
+
+def _write_sparse(dst, chunk: bytes, before_hole) -> int:
+    """Write chunk, seeking over all-zero SPARSE_BLOCK blocks; returns the bytes skipped"""
+    view = memoryview(chunk)
+    size = len(view)
+    skipped = 0
+    start = 0  # first byte not written yet
+    # Chunks are COPY_CHUNK_SIZE long, so blocks stay aligned on file offsets
+    for pos in range(0, size - SPARSE_BLOCK + 1, SPARSE_BLOCK):
+        # startswith is a plain memcmp at an offset, no slice copy
+        if chunk.startswith(_ZERO_BLOCK, pos):
+            if start < pos:
+                dst.write(view[start:pos])
+            if not skipped:
+                before_hole()
+            dst.seek(SPARSE_BLOCK, io.SEEK_CUR)
+            skipped += SPARSE_BLOCK
+            start = pos + SPARSE_BLOCK
+    if start < size:
+        dst.write(view[start:])
+    return skipped
+
+def _write_member(z: zipfile.ZipFile, member: zipfile.ZipInfo, target: Path, cancel: threading.Event = None, make_parents: bool = True, io_stats: dict = None, fsync: bool = False) -> int:
+    """
+    Stream one member to disk through the global bandwidth limiter (CRC checked by zipfile),
+    returns bytes written. Zero blocks skipped by sparse writes are added to io_stats["sparse_saved"].
+    """
+    if member.is_dir():
+        if make_parents:
+            target.mkdir(parents=True, exist_ok=True)
+        return 0
+    if make_parents:
+        target.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    holes = 0
+    sparse = SPARSE_WRITES and member.file_size >= SPARSE_MIN_SIZE
+    with z.open(member) as src, open(target, "wb") as dst:
+        flagged = []
+
+        def before_hole():
+            if not flagged:
+                _set_sparse_flag(dst)
+                flagged.append(True)
+
+        while True:
+            chunk = src.read(COPY_CHUNK_SIZE)
+            if not chunk:
+                break
+            if sparse:
+                skipped = _write_sparse(dst, chunk, before_hole)
+            else:
+                dst.write(chunk)
+                skipped = 0
+            written += len(chunk)
+            holes += skipped
+            IO_LIMITER.consume(len(chunk) - skipped)
+            # Large members can take minutes, don't make shutdown wait for them
+            if cancel is not None and cancel.is_set():
+                raise ExtractionCancelled(member.filename)
+        if holes:
+            # A trailing hole only moved the file position, set the length explicitly
+            dst.truncate(written)
+        if fsync:
+            dst.flush()
+            os.fsync(dst.fileno())
+    if holes and io_stats is not None:
+        io_stats["sparse_saved"] = io_stats.get("sparse_saved", 0) + holes
+    return written
+
+def _create_tree(dest_dir: Path, todo: list):
+    """Create every directory the members need once, instead of a mkdir per member"""
+    dirs = set()
+    for _, member, target, _ in todo:
+        dirs.add(target if member.is_dir() else target.parent)
+    dirs.discard(dest_dir)
+    # Sorted, parents come before their children so each makedirs is a single mkdir
+    for path in sorted(dirs, key=lambda p: len(p.parts)):
+        os.makedirs(path, exist_ok=True)
+
+# Members up to this size are decompressed in memory and handed to writer threads:
+# on Windows create/close dominate tiny files (AV scanners hook close), so several are kept in flight
+SMALL_FILE_MAX_SIZE = 256 * 1024
+SMALL_FILE_WRITERS = 4
+SMALL_FILE_IN_FLIGHT = 64
+# Checkpoint lines are flushed at most this often instead of after every member
+CHECKPOINT_FLUSH_INTERVAL = 0.5
+
+def _write_small_file(target: Path, data: bytes, fsync: bool = False):
+    with open(target, "wb") as dst:
+        dst.write(data)
+        if fsync:
+            dst.flush()
+            os.fsync(dst.fileno())
+
+def _fsync_path(path: Path, directory: bool = False):
+    if directory:
+        # Windows cannot open directories this way; NTFS journals their metadata anyway
+        if IS_WINDOWS:
+            return
+        flags = os.O_RDONLY
+    else:
+        # FlushFileBuffers needs a handle with write access
+        flags = os.O_RDWR if IS_WINDOWS else os.O_RDONLY
+    fd = os.open(path, flags | getattr(os, "O_BINARY", 0))
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def sync_extraction(dest_dir: Path, entries: list):
+    """
+    Make an extraction durable: fsync the written files (unless already done per file),
+    then every directory holding them, deepest first, up to the parent of dest_dir.
+    """
+    dirs = {dest_dir, dest_dir.parent}
+    files = []
+    for entry in entries:
+        target = dest_dir / entry["path"]
+        if entry["dir"]:
+            dirs.add(target)
+        else:
+            files.append(target)
+            dirs.add(target.parent)
+    if DURABILITY == "commit" and files:
+        # Flushes issued together let the device merge them
+        with ThreadPoolExecutor(max_workers=SMALL_FILE_WRITERS, thread_name_prefix="unzip-sync", initializer=apply_worker_priority) as pool:
+            for _ in pool.map(_fsync_path, files):
+                pass
+    for directory in sorted(dirs, key=lambda p: len(p.parts), reverse=True):
+        _fsync_path(directory, directory=True)
+
+def _extract_sequential(z: zipfile.ZipFile, zip_path: Path, todo: list, record, cancel: threading.Event = None, io_stats: dict = None, fsync: bool = False):
+    """
+    Extract todo [(index, member, target, rel)] in this thread; small members are
+    written by a few writer threads while the next ones are decompressed.
+    Directories must already exist (see _create_tree). fsync: flush each file as it is closed.
+    """
+    in_flight = []
+
+    def finish_oldest():
+        future, index, member, rel, t0 = in_flight.pop(0)
+        future.result()
+        record(index, member, rel, time.perf_counter() - t0)
+
+    with ThreadPoolExecutor(max_workers=SMALL_FILE_WRITERS, thread_name_prefix="unzip-write", initializer=apply_worker_priority) as writers:
+        try:
+            for index, member, target, rel in todo:
+                if cancel is not None and cancel.is_set():
+                    # Writes already handed out are quick, keep them in the checkpoint
+                    while in_flight:
+                        finish_oldest()
+                    raise ExtractionCancelled(zip_path.name)
+                t0 = time.perf_counter()
+                if member.is_dir():
+                    record(index, member, rel, 0.0)
+                elif member.file_size <= SMALL_FILE_MAX_SIZE:
+                    # zipfile checks the CRC when the whole member has been read
+                    data = z.read(member)
+                    IO_LIMITER.consume(len(data))
+                    in_flight.append((writers.submit(_write_small_file, target, data, fsync), index, member, rel, t0))
+                    if len(in_flight) >= SMALL_FILE_IN_FLIGHT:
+                        finish_oldest()
+                else:
+                    _write_member(z, member, target, cancel, make_parents=False, io_stats=io_stats, fsync=fsync)
+                    record(index, member, rel, time.perf_counter() - t0)
+            while in_flight:
+                finish_oldest()
+        finally:
+            for future, *_ in in_flight:
+                future.cancel()
+
+# =========================
+# Multi-process decompression (optional)
+# =========================
+
+# "thread": decompress in the calling thread; "process": spread the members of
+# CPU-heavy archives (deflate/bzip2/lzma) over a process pool, sidestepping the GIL
+EXTRACT_BACKEND = "thread"
+PROCESS_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+PROCESS_MIN_COMPRESSED = 32 * 1024 * 1024  # below this, process round-trips cost more than they save
+PROCESS_BATCH_BYTES = 16 * 1024 * 1024  # members are sent to workers in batches of about this size
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+def _process_worker_init(rate: int, priority_mode: str):
+    global PRIORITY_MODE
+    # Each worker gets its share of the global bandwidth budget
+    IO_LIMITER.rate = rate
+    PRIORITY_MODE = priority_mode
+    apply_worker_priority()
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=PROCESS_WORKERS,
+                # Never fork the multithreaded watcher: children would inherit its signal
+                # handlers, the instance lock fd and locks held by other threads. Same
+                # model as the Windows build.
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_process_worker_init,
+                initargs=(IO_BANDWIDTH_LIMIT // PROCESS_WORKERS, PRIORITY_MODE),
+            )
+        return _process_pool
+
+def shutdown_process_pool():
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False)
+            _process_pool = None
+
+class _AbortMarker:
+    """
+    Cross-process abort flag for one job: set once the marker file exists. Pool workers are
+    shared by all jobs, so a per-job file is simpler than a synchronisation primitive.
+    """
+    CHECK_INTERVAL = 0.25
+
+    def __init__(self, path: str):
+        self.path = path
+        self._checked = 0.0
+        self._set = False
+
+    def is_set(self) -> bool:
+        now = time.monotonic()
+        if not self._set and now - self._checked >= self.CHECK_INTERVAL:
+            self._checked = now
+            self._set = os.path.exists(self.path)
+        return self._set
+
+def _process_extract_batch(zip_path: str, batch: list, abort_path: str, fsync: bool) -> list:
+    """
+    Runs in a worker process: decompress a batch of (index, target) members straight to
+    their destination. The archive is opened once per batch and closed afterwards so no
+    worker keeps it locked (the source may be deleted right after extraction).
+    Directories were created by the parent; once the job is aborted (abort_path exists)
+    the batch stops, and never recreates a folder the parent has just removed.
+    """
+    results = []
+    abort = _AbortMarker(abort_path)
+    with zipfile.ZipFile(zip_path) as z:
+        infos = z.infolist()
+        for index, target in batch:
+            if abort.is_set():
+                raise ExtractionCancelled(zip_path)
+            t0 = time.perf_counter()
+            io_stats = {}
+            written = _write_member(z, infos[index], Path(target), cancel=abort, make_parents=False, io_stats=io_stats, fsync=fsync)
+            results.append((index, written, time.perf_counter() - t0, io_stats.get("sparse_saved", 0)))
+    return results
+
+def _use_process_backend(todo: list) -> bool:
+    if EXTRACT_BACKEND != "process" or PROCESS_WORKERS < 2 or len(todo) < 2:
+        return False
+    compressed = sum(m.compress_size for _, m, _, _ in todo if m.compress_type != zipfile.ZIP_STORED)
+    return compressed >= PROCESS_MIN_COMPRESSED
+
+def _extract_in_processes(zip_path: Path, todo: list, record, budget: int, cancel: threading.Event = None, io_stats: dict = None, fsync: bool = False):
+    """
+    Extract todo [(index, member, target, rel)] on the process pool. The parent keeps the
+    global byte budget: workers report what they wrote and the job aborts if the total
+    goes over what the central directory declared.
+    """
+    # Directories are instant, create them here so workers only write files
+    files = []
+    for index, member, target, rel in todo:
+        if member.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+            record(index, member, rel, 0.0)
+        else:
+            files.append((index, member, target, rel))
+
+    # Largest members first so the long tail starts early; small ones grouped into batches
+    files.sort(key=lambda item: item[1].file_size, reverse=True)
+    batches, current, current_bytes = [], [], 0
+    for index, member, target, rel in files:
+        current.append((index, str(target)))
+        current_bytes += member.file_size
+        if current_bytes >= PROCESS_BATCH_BYTES:
+            batches.append(current)
+            current, current_bytes = [], 0
+    if current:
+        batches.append(current)
+
+    by_index = {index: (member, rel) for index, member, _, rel in files}
+    pool = _get_process_pool()
+    abort_path = os.path.join(tempfile.gettempdir(), f"auto-unzip-abort-{os.getpid()}-{secrets.token_hex(8)}")
+    pending = {pool.submit(_process_extract_batch, str(zip_path), batch, abort_path, fsync) for batch in batches}
+    written_total = 0
+    try:
+        while pending:
+            finished, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            for future in finished:
+                for index, written, elapsed, saved in future.result():
+                    member, rel = by_index[index]
+                    written_total += written
+                    if written > member.file_size or written_total > budget:
+                        raise RuntimeError("Extraction blocked (decompressed data exceeds declared size)")
+                    if saved and io_stats is not None:
+                        io_stats["sparse_saved"] = io_stats.get("sparse_saved", 0) + saved
+                    record(index, member, rel, elapsed)
+            if cancel is not None and cancel.is_set():
+                raise ExtractionCancelled(zip_path.name)
+    except BaseException:
+        running = [future for future in pending if not future.cancel()]
+        if running:
+            # The caller may remove the folder as soon as this returns: stop the batches
+            # still running and wait until no worker can write into it any more
+            try:
+                open(abort_path, "wb").close()
+            except OSError as e:
+                logging.warning("Could not signal process workers to stop: %s", e)
+            wait(running)
+            try:
+                os.unlink(abort_path)
+            except OSError:
+                pass
+        raise
+
+def checkpoint_path_for(zip_path: Path, dest_dir: Path, directory: Path = None) -> Path:
+    return (directory or CHECKPOINT_DIR) / manifest_path_for(zip_path, dest_dir).name
+
+def _archive_identity(zip_path: Path, dest_dir: Path) -> dict:
+    st = zip_path.stat()
+    return {"archive": str(zip_path), "dest": str(dest_dir), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+def _read_checkpoint(checkpoint: Path):
+    """Return (header, {relative path: entry}) or (None, {}) if missing/unreadable"""
+    try:
+        with open(checkpoint, "r", encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+    except (OSError, ValueError):
+        # A torn last line after a crash is expected, the member is simply redone
+        return None, {}
+    if not lines:
+        return None, {}
+    return lines[0], {e["path"]: e for e in lines[1:]}
+
+def _member_intact(target: Path, entry: dict) -> bool:
+    try:
+        if entry["dir"]:
+            return target.is_dir()
+        return target.stat().st_size == entry["size"]
+    except OSError:
+        return False
+
+def watcher_extract_dir(zip_path: Path) -> Path:
+    """Where the watcher extracts an archive"""
+    return zip_path.parent / archive_stem(zip_path) if EXTRACT_IN_SUBFOLDER else zip_path.parent
+
+def pending_checkpoints(journal: "JobJournal" = None) -> list:
+    """
+    Archives whose watcher extraction was interrupted and can be resumed. Stale checkpoints,
+    and ones the watcher would not resume (other destination, archive outside Downloads,
+    job recorded as failed in the journal), are removed.
+    """
+    pending = []
+    if not CHECKPOINT_DIR.exists():
+        return pending
+    for checkpoint in CHECKPOINT_DIR.glob("*.jsonl"):
+        header, _ = _read_checkpoint(checkpoint)
+        try:
+            zip_path = Path(header["archive"])
+            if (
+                _archive_identity(zip_path, Path(header["dest"])) == header
+                and header["dest"] == str(watcher_extract_dir(zip_path))
+                and is_within_directory(DOWNLOADS, zip_path)
+                and (journal is None or journal.last_state(zip_path) != "failed")
+            ):
+                pending.append(zip_path)
+                continue
+        except (TypeError, KeyError, OSError):
+            pass
+        checkpoint.unlink(missing_ok=True)
+    return pending
+
+def _find_overlap(z: zipfile.ZipFile, check_tail: bool = True):
+    """
+    First member whose data runs into the next member's local header (or into the central
+    directory), None if there is none. Uses the smallest possible local header (30 bytes,
+    empty name and extra), so a well-formed archive can never be flagged.
+    """
+    members = sorted(z.infolist(), key=lambda m: m.header_offset)
+    for member, following in zip(members, members[1:]):
+        if member.header_offset + 30 + member.compress_size > following.header_offset:
+            return member
+    if check_tail and members and members[-1].header_offset + 30 + members[-1].compress_size > z.start_dir:
+        return members[-1]
+    return None
+
+def safe_extract(zip_path: Path, dest_dir: Path, cancel: threading.Event = None, checkpoint: bool = False, verified: set = None, checkpoint_dir: Path = None, sync: bool = False) -> list:
+    """
+    Safely extract ZIP with comprehensive security checks, returns the manifest entries.
+    cancel is checked between members (raises ExtractionCancelled); with checkpoint=True
+    completed members are recorded (in checkpoint_dir, CHECKPOINT_DIR by default) so a
+    later call with the same arguments resumes.
+    verified, if given, receives the paths of files CRC-checked while being written.
+    sync=True makes the output durable (see DURABILITY) before returning, for callers
+    that delete the archive afterwards.
+    """
     dest_dir.mkdir(parents=True, exist_ok=True)
     
+    parts = split_archive_parts(zip_path)
+
     # SECURITY: Reject suspiciously large ZIP files before processing
     try:
-        zip_size = zip_path.stat().st_size
+        zip_size = sum(part.stat().st_size for part in parts or [zip_path])
         if zip_size > MAX_ZIP_FILE_SIZE:
             raise ValueError(f"ZIP file exceeds maximum size ({zip_size} > {MAX_ZIP_FILE_SIZE})")
     except OSError as e:
         raise RuntimeError(f"Cannot stat ZIP file: {e}")
 
-    with zipfile.ZipFile(zip_path) as z:
+    if parts:
+        source = MultiPartFile.open(zip_path, parts)
+    elif zip_size <= IN_MEMORY_MAX_SIZE:
+        with open(zip_path, "rb") as f:
+            source = io.BytesIO(f.read())
+    else:
+        source = zip_path
+
+    with source if parts else nullcontext(), zipfile.ZipFile(source) as z:
+        if parts:
+            _rebase_split_offsets(z, source)
         total_size = 0
         
+        # Before the per-member checks: resolving 65k paths only to reject the count takes seconds
+        if len(z.infolist()) > MAX_FILES:
+            raise ValueError(f"Archive contains too many files ({len(z.infolist())} > {MAX_FILES})")
+        
+        # Security check 8: Overlapping entries (bombs that reuse the same compressed data)
+        if _find_overlap(z, check_tail=not parts):
+            raise RuntimeError("Extraction blocked (overlapping entries detected)")
+        
         for member in z.infolist():
             # Security check 1: Reject null bytes
             if '\x00' in member.filename or '\0' in member.filename:
@@ -893,51 +2132,988 @@ def safe_extract(zip_path: Path, dest_dir: Path) -> None:
                 raise RuntimeError("Extraction blocked (path traversal or symlink attack detected)")
         
         # All checks passed
-        if len(z.infolist()) > MAX_FILES:
-            raise ValueError(f"Archive contains too many files ({len(z.infolist())} > {MAX_FILES})")
-        
-        z.extractall(dest_dir)
 
-def robust_delete(path: Path):
-    """Safely delete a file with retry logic and security validation"""
+        # Resume state: members already written by an interrupted run of the same archive
+        cp_path = checkpoint_path_for(zip_path, dest_dir, checkpoint_dir) if checkpoint else None
+        done = {}
+        cp_file = None
+        if cp_path is not None:
+            identity = _archive_identity(zip_path, dest_dir)
+            header, done = _read_checkpoint(cp_path)
+            if header != identity:
+                done = {}
+
+        # Admission: make sure the remaining decompressed data fits before writing anything
+        # (a rejected job must not leave a checkpoint behind to be resumed on every launch)
+        planned = max(0, total_size - sum(e["size"] for e in done.values()))
+        volume = DISK_ADMISSION.acquire(dest_dir, planned)
+        unwritten = [planned]
+        try:
+            if cp_path is not None:
+                cp_path.parent.mkdir(parents=True, exist_ok=True)
+                cp_file = open(cp_path, "a" if done else "w", encoding="utf-8")
+                if not done:
+                    cp_file.write(json.dumps(identity, separators=(",", ":")) + "\n")
+                else:
+                    logging.info("Resuming extraction of %s (%d members already done)", zip_path.name, len(done))
+
+            # Extract member by member so each written file can be recorded in the manifest
+            entries = {}
+            todo = []
+            for index, member in enumerate(z.infolist()):
+                target = _member_target(dest_dir, member)
+                rel = Path(os.path.relpath(target, dest_dir)).as_posix()
+                previous = done.get(rel)
+                if previous is not None and _member_intact(target, previous):
+                    entries[index] = previous
+                else:
+                    todo.append((index, member, target, rel))
+
+            last_flush = [time.monotonic()]
+
+            def record(index, member, rel, elapsed):
+                entry = {
+                    "path": rel,
+                    "size": member.file_size,
+                    "crc": member.CRC,
+                    "dir": member.is_dir(),
+                    "ms": round(elapsed * 1000, 3),
+                }
+                entries[index] = entry
+                if member.file_size and unwritten[0]:
+                    done_bytes = min(member.file_size, unwritten[0])
+                    DISK_ADMISSION.written(volume, done_bytes)
+                    unwritten[0] -= done_bytes
+                if verified is not None and not entry["dir"]:
+                    # zipfile raises on a CRC mismatch once a member is fully read
+                    verified.add(rel)
+                if cp_file is not None:
+                    cp_file.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+                    # Unflushed lines only mean a few members are rewritten on resume
+                    now = time.monotonic()
+                    if now - last_flush[0] >= CHECKPOINT_FLUSH_INTERVAL:
+                        cp_file.flush()
+                        last_flush[0] = now
+
+            io_stats = {}
+            fsync = sync and DURABILITY == "per-file"
+            _create_tree(dest_dir, todo)
+            # Workers reopen the archive by path, split archives stay in this process
+            if not parts and _use_process_backend(todo):
+                _extract_in_processes(zip_path, todo, record, planned, cancel, io_stats, fsync)
+            else:
+                _extract_sequential(z, zip_path, todo, record, cancel, io_stats, fsync)
+            if io_stats.get("sparse_saved"):
+                logging.info("Sparse writes skipped %.1f MB of zeros in %s", io_stats["sparse_saved"] / 1e6, zip_path.name)
+            entries = [entries[i] for i in sorted(entries)]
+            if sync and DURABILITY != "none":
+                # Before the checkpoint goes away and the caller may delete the archive
+                sync_extraction(dest_dir, entries)
+        except ExtractionCancelled:
+            raise
+        except BaseException:
+            # Failed extractions are cleaned up by the caller, nothing left to resume
+            if cp_file is not None:
+                cp_file.close()
+                cp_path.unlink(missing_ok=True)
+            raise
+        finally:
+            DISK_ADMISSION.release(volume, unwritten[0])
+            if cp_file is not None:
+                cp_file.close()
+
+        if cp_path is not None:
+            cp_path.unlink(missing_ok=True)
+        return entries
+
+# =========================
+# Extraction manifests
+# =========================
+
+def manifest_path_for(zip_path: Path, dest_dir: Path) -> Path:
+    """Manifest location for an archive/destination pair (stable across runs)"""
+    # The full archive path: same-named archives from different folders must not share one
+    key = hashlib.sha1(f"{dest_dir}|{zip_path.resolve()}".lower().encode("utf-8")).hexdigest()[:12]
+    # Keep only harmless characters from the archive name for readability
+    stem = "".join(c if c.isalnum() or c in "-_." else "_" for c in zip_path.stem)[:64]
+    return MANIFEST_DIR / f"{stem}-{key}.jsonl"
+
+def write_manifest(zip_path: Path, dest_dir: Path, entries: list, started: float, finished: float) -> Path:
+    """
+    Write the JSON-lines manifest of an extraction: one header line, then one line per member.
+    Written to a temporary file and renamed so a crash never leaves a truncated manifest.
+    """
+    MANIFEST_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = manifest_path_for(zip_path, dest_dir)
+    header = {
+        "manifest": MANIFEST_VERSION,
+        "archive": zip_path.name,
+        "dest": str(dest_dir),
+        "started": round(started, 3),
+        "finished": round(finished, 3),
+        "elapsed": round(finished - started, 3),
+        "members": len(entries),
+        "total_size": sum(e["size"] for e in entries),
+    }
+    tmp = manifest.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(json.dumps(header, ensure_ascii=False, separators=(",", ":")) + "\n")
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+    os.replace(tmp, manifest)
+    return manifest
+
+def load_manifest(manifest: Path):
+    """Return (header, entries) from a manifest file"""
+    with open(manifest, "r", encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f if line.strip()]
+    if not lines or lines[0].get("manifest") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported manifest: {manifest.name}")
+    return lines[0], lines[1:]
+
+# One read buffer per verifying thread, allocated on its first file instead of for every file
+_crc_buffers = threading.local()
+
+def _file_crc32(path: Path, buffer_size: int = 1024 * 1024) -> int:
+    crc = 0
+    buffer = getattr(_crc_buffers, "buffer", None)
+    if buffer is None or len(buffer) != buffer_size:
+        buffer = _crc_buffers.buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            crc = zlib.crc32(view[:n], crc)
+    return crc
+
+def _entry_matches(dest_dir: Path, entry: dict, check_crc: bool) -> bool:
+    target = dest_dir / entry["path"]
+    try:
+        if entry["dir"]:
+            return target.is_dir()
+        if target.stat().st_size != entry["size"]:
+            return False
+        return not check_crc or _file_crc32(target, VERIFY_BUFFER_SIZE) == entry["crc"]
+    except OSError:
+        return False
+
+def verify_entries(dest_dir: Path, entries: list, check_crc: bool = True, skip_crc: set = frozenset()) -> list:
+    """
+    Check extracted files against their entries, CRC32 re-reads spread over VERIFY_WORKERS
+    threads (zlib releases the GIL). Files in skip_crc only get the size check.
+    Returns the relative paths that are missing or differ (empty list = OK).
+    """
+    checks = [(entry, check_crc and entry["path"] not in skip_crc) for entry in entries]
+    with ThreadPoolExecutor(max_workers=VERIFY_WORKERS, thread_name_prefix="unzip-verify", initializer=apply_worker_priority) as pool:
+        results = pool.map(lambda item: _entry_matches(dest_dir, *item), checks)
+        return [entry["path"] for (entry, _), ok in zip(checks, results) if not ok]
+
+def verify_manifest(manifest: Path, check_crc: bool = False) -> list:
+    """
+    Check the extracted files against their manifest without rescanning the tree.
+    Returns the relative paths that are missing or differ (empty list = OK).
+    """
+    header, entries = load_manifest(manifest)
+    return verify_entries(Path(header["dest"]), entries, check_crc)
+
+def undo_extraction(manifest: Path) -> int:
+    """
+    Remove exactly what an extraction wrote (files, then emptied directories), then the manifest.
+    Returns the number of removed entries.
+    """
+    header, entries = load_manifest(manifest)
+    dest_dir = Path(header["dest"])
+    removed = 0
+    dirs = set()
+    for entry in entries:
+        target = dest_dir / entry["path"]
+        # SECURITY: never follow a manifest outside its destination
+        if not is_within_directory(dest_dir, target):
+            logging.warning("Manifest entry outside destination ignored: %s", entry["path"])
+            continue
+        if entry["dir"]:
+            dirs.add(target)
+            continue
+        dirs.update(p for p in target.parents if p != dest_dir and dest_dir in p.parents)
+        try:
+            target.unlink()
+            removed += 1
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.warning("Undo could not remove %s: %s", entry["path"], e)
+    # Deepest directories first; keep anything that now holds foreign files
+    for d in sorted(dirs, key=lambda p: len(p.parts), reverse=True):
+        try:
+            d.rmdir()
+            removed += 1
+        except OSError:
+            pass
+    if dest_dir != DOWNLOADS:
+        try:
+            dest_dir.rmdir()
+        except OSError:
+            pass
+    manifest.unlink(missing_ok=True)
+    return removed
+
+def prune_manifests(retention: float = MANIFEST_RETENTION) -> int:
+    """
+    Remove manifests older than retention, whose destination no longer exists, or that
+    cannot be read, plus temporary files left by a crash. Returns the number removed.
+    """
+    cutoff = time.time() - retention
+    removed = 0
+    try:
+        candidates = list(MANIFEST_DIR.glob("*.jsonl")) + list(MANIFEST_DIR.glob("*.tmp"))
+    except OSError:
+        return 0
+    for manifest in candidates:
+        try:
+            mtime = manifest.stat().st_mtime
+            if manifest.suffix == ".tmp":
+                # Left by a crash, unless a batch run is writing it right now
+                stale = mtime < time.time() - 3600
+            elif mtime < cutoff:
+                stale = True
+            else:
+                # Only the header is needed: members are never read here
+                with open(manifest, "r", encoding="utf-8") as f:
+                    header = json.loads(f.readline())
+                stale = header.get("manifest") != MANIFEST_VERSION or not Path(header["dest"]).is_dir()
+        except OSError:
+            continue
+        except (ValueError, KeyError, TypeError, AttributeError):
+            stale = True  # unreadable: useless for verify/undo
+        if stale:
+            try:
+                manifest.unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logging.warning("Could not prune manifest %s: %s", manifest.name, e)
+    return removed
+
+# =========================
+# Deletion
+# =========================
+
+DELETE_BACKOFF_START = 0.05
+DELETE_BACKOFF_MAX = 2.0
+DELETE_RETRY_TIMEOUT = 30.0  # background deletions keep retrying a locked archive this long
+
+@lru_cache(maxsize=1)
+def _allowed_delete_roots() -> tuple:
+    """Resolved monitored locations, computed once instead of on every deletion"""
+    return tuple(str(root.resolve()).lower().rstrip("\\/") for root in (DOWNLOADS, INSTALL_DIR))
+
+def _validate_deletable(path: Path) -> bool:
+    """SECURITY: only plain files inside the monitored locations may be deleted"""
     try:
         if not path.exists():
-            return
+            return False
         
         # SECURITY: Check for symlink/junction BEFORE any path operations
         # This prevents TOCTOU where symlink could be created between checks
         if path.is_symlink():
             logging.warning("Refusing to delete symlink: %s", path)
-            return
+            return False
         
         # Validate path is within expected monitored locations for safety
-        path_resolved = path.resolve()
-        downloads_resolved = DOWNLOADS.resolve()
-        install_resolved = INSTALL_DIR.resolve()
-        
-        is_in_downloads = str(path_resolved).lower().startswith(str(downloads_resolved).lower())
-        is_in_install = str(path_resolved).lower().startswith(str(install_resolved).lower())
-        
-        if not (is_in_downloads or is_in_install):
+        path_resolved = str(path.resolve()).lower()
+        if not any(path_resolved.startswith(root + os.sep) for root in _allowed_delete_roots()):
             logging.warning("Refusing to delete file outside monitored locations: %s", path)
-            return
+            return False
+        return True
     except Exception:
         logging.warning("Could not validate path for deletion: %s", path)
-        return
+        return False
+
+def robust_delete(path: Path, timeout: float = 5.0) -> bool:
+    """Safely delete a file with retry logic (exponential backoff) and security validation"""
+    if not _validate_deletable(path):
+        return False
     
-    for _ in range(10):
+    deadline = time.monotonic() + timeout
+    delay = DELETE_BACKOFF_START
+    while True:
         try:
             path.unlink()
-            return
+            return True
         except FileNotFoundError:
-            return
+            return True
+        except PermissionError:
+            if time.monotonic() + delay > deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2, DELETE_BACKOFF_MAX)
+
+class DeletionService:
+    """
+    Deletes archives on a background thread so extraction workers never wait on a locked file.
+    Locked files are retried with exponential backoff; all due retries are handled in one pass.
+    """
+
+    def __init__(self, retry_timeout: float = DELETE_RETRY_TIMEOUT):
+        self.retry_timeout = retry_timeout
+        self._cond = threading.Condition()
+        self._heap = []  # (due, seq, path, submitted, attempts, delay, on_done)
+        self._seq = itertools.count()
+        self._stopping = False
+        self._stats = {"deleted": 0, "failed": 0, "total_latency": 0.0, "max_latency": 0.0}
+        self._thread = threading.Thread(target=self._run, name="unzip-delete", daemon=True)
+        self._thread.start()
+
+    def submit(self, path: Path, on_done=None) -> bool:
+        """on_done(deleted: bool) is called on the deletion thread once the archive is gone or given up"""
+        if not _validate_deletable(path):
+            return False
+        now = time.monotonic()
+        with self._cond:
+            heapq.heappush(self._heap, (now, next(self._seq), path, now, 0, DELETE_BACKOFF_START, on_done))
+            self._cond.notify_all()
+        return True
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if not self._heap:
+                        if self._stopping:
+                            return
+                        self._cond.wait()
+                        continue
+                    now = time.monotonic()
+                    if self._heap[0][0] <= now:
+                        break
+                    self._cond.wait(self._heap[0][0] - now)
+                batch = []
+                while self._heap and self._heap[0][0] <= now:
+                    batch.append(heapq.heappop(self._heap))
+            for item in batch:
+                self._attempt(*item)
+
+    def _attempt(self, due, seq, path, submitted, attempts, delay, on_done):
+        attempts += 1
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
         except PermissionError:
-            time.sleep(0.5)
+            now = time.monotonic()
+            if now - submitted + delay > self.retry_timeout:
+                logging.warning("Archive still locked after %d attempts, not deleted: %s", attempts, path.name)
+                with self._cond:
+                    self._stats["failed"] += 1
+                self._done(on_done, False)
+                return
+            with self._cond:
+                heapq.heappush(self._heap, (now + delay, seq, path, submitted, attempts, min(delay * 2, DELETE_BACKOFF_MAX), on_done))
+            return
+        except OSError as e:
+            logging.warning("Failed to delete archive %s: %s", path.name, e)
+            with self._cond:
+                self._stats["failed"] += 1
+            self._done(on_done, False)
+            return
+        latency = time.monotonic() - submitted
+        logging.info("Archive deleted: %s (%.0f ms, %d attempt(s))", path.name, latency * 1000, attempts)
+        with self._cond:
+            self._stats["deleted"] += 1
+            self._stats["total_latency"] += latency
+            self._stats["max_latency"] = max(self._stats["max_latency"], latency)
+        self._done(on_done, True)
+
+    @staticmethod
+    def _done(on_done, deleted: bool):
+        if on_done is None:
+            return
+        try:
+            on_done(deleted)
+        except Exception as e:
+            logging.warning("Deletion callback failed: %s", e)
+
+    def stats(self) -> dict:
+        with self._cond:
+            stats = dict(self._stats)
+            stats["queued"] = len(self._heap)
+        stats["avg_latency"] = stats["total_latency"] / stats["deleted"] if stats["deleted"] else 0.0
+        return stats
+
+    def stop(self, timeout: float = 5.0):
+        """Finish pending deletions (bounded by timeout), then stop the thread"""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join(timeout=timeout)
+
+# =========================
+# Job journal
+# =========================
+
+# Each job appends queued -> extracting -> extracted -> done (or failed/cancelled) for its
+# archive. One row per transition in a WAL-mode SQLite file: an insert is a sequential append,
+# and a crash can lose at most the transition being written, never corrupt earlier ones.
+JOURNAL_TERMINAL_STATES = ("done", "failed")
+JOURNAL_RETENTION = 7 * 24 * 3600  # finished jobs are kept this long for diagnostics
+
+class JobJournal:
+    """Durable record of where every archive's job stands, shared by all worker threads"""
+
+    def __init__(self, path: Path = JOURNAL_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._stats = {"written": 0, "errors": 0}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # FULL syncs the WAL on every commit: "extracted" must be on disk before the archive
+        # is deleted. Without durability for the output itself that guarantee buys nothing.
+        self._conn.execute("PRAGMA synchronous=%s" % ("NORMAL" if DURABILITY == "none" else "FULL"))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            "seq INTEGER PRIMARY KEY AUTOINCREMENT, archive TEXT NOT NULL, "
+            "state TEXT NOT NULL, at REAL NOT NULL, detail TEXT)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS events_archive ON events(archive, seq)")
+        _restrict_file_permissions(path)
+
+    def record(self, archive: Path, state: str, **detail):
+        """Append a transition; failures are logged, a job never fails because of its journal"""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT INTO events (archive, state, at, detail) VALUES (?, ?, ?, ?)",
+                    (str(archive), state, time.time(), json.dumps(detail, separators=(",", ":")) if detail else None),
+                )
+                self._stats["written"] += 1
+            except sqlite3.Error as e:
+                self._stats["errors"] += 1
+                logging.warning("Job journal write failed (%s %s): %s", state, Path(archive).name, e)
+
+    def unfinished(self) -> list:
+        """
+        Replay the journal: (archive, last state, detail of its last "extracting" transition)
+        for every job that did not reach a terminal state, oldest first.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT e.archive, e.state, "
+                "(SELECT x.detail FROM events x WHERE x.archive = e.archive AND x.state = 'extracting' "
+                "ORDER BY x.seq DESC LIMIT 1) "
+                "FROM events e WHERE e.seq IN (SELECT MAX(seq) FROM events GROUP BY archive) "
+                "AND e.state NOT IN (%s) ORDER BY e.seq" % ",".join("?" * len(JOURNAL_TERMINAL_STATES)),
+                JOURNAL_TERMINAL_STATES,
+            ).fetchall()
+        return [(Path(archive), state, json.loads(detail) if detail else {}) for archive, state, detail in rows]
+
+    def last_state(self, archive: Path):
+        """Latest recorded state of an archive's job, None if it has none"""
+        with self._lock:
+            if self._conn is None:
+                return None
+            try:
+                row = self._conn.execute(
+                    "SELECT state FROM events WHERE archive = ? ORDER BY seq DESC LIMIT 1", (str(archive),)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logging.warning("Job journal read failed for %s: %s", Path(archive).name, e)
+                return None
+        return row[0] if row else None
+
+    def compact(self, retention: float = JOURNAL_RETENTION) -> int:
+        """Drop old transitions of finished jobs, returns the number of rows removed"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM events WHERE at < ? AND archive NOT IN ("
+                "SELECT archive FROM events WHERE seq IN (SELECT MAX(seq) FROM events GROUP BY archive) "
+                "AND state NOT IN (%s))" % ",".join("?" * len(JOURNAL_TERMINAL_STATES)),
+                (time.time() - retention, *JOURNAL_TERMINAL_STATES),
+            )
+            # Fold the WAL back into the database so it does not grow across sessions
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            return cursor.rowcount
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+def open_job_journal():
+    """The watcher's journal, or None (jobs run unjournaled) if the file cannot be opened"""
+    try:
+        journal = JobJournal()
+        removed = journal.compact()
+        if removed:
+            logging.info("Job journal compacted: %d old transitions removed", removed)
+        return journal
+    except (sqlite3.Error, OSError) as e:
+        logging.warning("Job journal unavailable, interrupted jobs will not be recovered: %s", e)
+        return None
+
+# =========================
+# Job scheduling
+# =========================
+
+# Jobs are ranked by estimated cost (bytes of work); cheap archives get their own lane
+# so a multi-GB download never holds back the small ones queued behind it.
+SMALL_JOB_MAX_COST = 64 * 1024 * 1024  # 64MB
+SMALL_LANE_WORKERS = 2
+LARGE_LANE_WORKERS = 1  # concurrency cap for large archives
+MEMBER_COST_BYTES = 64 * 1024  # per-member overhead (mkdir/open/close), expressed in bytes
+
+def estimate_job_cost(zip_path: Path) -> int:
+    """Rough extraction cost in bytes, from the archive size and its central directory"""
+    parts = split_archive_parts(zip_path)
+    try:
+        size = sum(part.stat().st_size for part in parts or [zip_path])
+    except OSError:
+        return 0
+    try:
+        with (MultiPartFile.open(zip_path, parts) if parts else open(zip_path, "rb")) as f, zipfile.ZipFile(f) as z:
+            infos = z.infolist()
+        return max(size, sum(i.file_size for i in infos)) + len(infos) * MEMBER_COST_BYTES
+    except Exception:
+        # Invalid archives fail fast in the worker, rank them by size only
+        return size
+
+class JobScheduler:
+    """
+    Worker pool with two lanes ordered by cost (cheapest first).
+    Small-lane workers only take small jobs; large-lane workers take large jobs first
+    and help with small ones when nothing large is waiting.
+    """
+
+    def __init__(self, small_workers: int = SMALL_LANE_WORKERS, large_workers: int = LARGE_LANE_WORKERS,
+                 small_max_cost: int = SMALL_JOB_MAX_COST):
+        self.small_max_cost = small_max_cost
+        self._cond = threading.Condition()
+        self._small = []
+        self._large = []
+        self._seq = itertools.count()
+        self._pending = set()
+        self._in_flight = {}
+        self._stopping = False
+        self._paused = False
+        # Set on stop(): running extractions checkpoint and return between members
+        self.cancel_event = threading.Event()
+        self._threads = []
+        for lane, count in (("small", small_workers), ("large", large_workers)):
+            for i in range(max(1, count)):
+                th = threading.Thread(target=self._worker, args=(lane,), name=f"unzip-{lane}-{i}", daemon=True)
+                th.start()
+                self._threads.append(th)
+
+    def submit(self, key, cost: int, fn) -> bool:
+        """Queue fn() under key (ignored if the same key is already queued or running)"""
+        with self._cond:
+            if self._stopping or key in self._pending or key in self._in_flight:
+                return False
+            heap = self._small if cost <= self.small_max_cost else self._large
+            heapq.heappush(heap, (cost, next(self._seq), key, fn))
+            self._pending.add(key)
+            self._cond.notify_all()
+        logging.info("Job queued (%s lane, cost=%d): %s", "small" if heap is self._small else "large", cost, key)
+        return True
+
+    def _next_job(self, lane: str):
+        with self._cond:
+            while True:
+                if self._stopping:
+                    return None
+                if self._paused:
+                    self._cond.wait()
+                    continue
+                if lane == "large" and self._large:
+                    job = heapq.heappop(self._large)
+                elif self._small:
+                    job = heapq.heappop(self._small)
+                else:
+                    self._cond.wait()
+                    continue
+                self._pending.discard(job[2])
+                self._in_flight[job[2]] = lane
+                return job
+
+    def _worker(self, lane: str):
+        apply_worker_priority()
+        while True:
+            job = self._next_job(lane)
+            if job is None:
+                return
+            cost, _, key, fn = job
+            try:
+                fn()
+            except Exception as e:
+                logging.exception("Job failed for %s: %s", key, e)
+            finally:
+                with self._cond:
+                    self._in_flight.pop(key, None)
+                    self._cond.notify_all()
+
+    def pause(self):
+        """Running jobs finish, queued ones wait for resume()"""
+        with self._cond:
+            self._paused = True
+
+    def resume(self):
+        with self._cond:
+            self._paused = False
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "paused": self._paused,
+                "queued_small": len(self._small),
+                "queued_large": len(self._large),
+                "in_flight": {str(k): lane for k, lane in self._in_flight.items()},
+            }
+
+    def stop(self, timeout: float = 5.0):
+        """Stop accepting jobs, drop queued ones and cancel running ones (they resume on restart)"""
+        self.cancel_event.set()
+        with self._cond:
+            self._stopping = True
+            self._small.clear()
+            self._large.clear()
+            self._pending.clear()
+            self._cond.notify_all()
+        deadline = time.time() + timeout
+        for th in self._threads:
+            th.join(timeout=max(0.0, deadline - time.time()))
+
+# =========================
+# Asyncio pipeline
+# =========================
+
+READY_CONCURRENCY = 10000  # pending readiness waits (coroutines, not threads)
+PIPELINE_QUEUE_SIZE = 1000  # detected archives waiting for a readiness slot
+PIPELINE_MAX_SCHEDULED = 64  # ready archives handed to the scheduler but not finished
+NOTIFY_QUEUE_SIZE = 100
+
+class AsyncPipeline:
+    """
+    detect -> ready -> extract -> notify as asyncio stages connected by bounded queues,
+    on an event loop in its own thread. Readiness waits are coroutines (file probes run on
+    a small executor), extraction runs on the JobScheduler lanes and toasts on a single
+    notification thread. Full queues block the stage before them, so bursts back up to
+    the watcher instead of growing memory or thread count.
+    """
+
+    def __init__(self, handler: "ZipHandler", scheduler: JobScheduler):
+        self.handler = handler
+        self.scheduler = scheduler
+        self.loop = asyncio.new_event_loop()
+        self._probe_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="unzip-probe")
+        self._notify_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="unzip-notify")
+        self._thread = threading.Thread(target=self._run_loop, name="unzip-pipeline", daemon=True)
+        self._started = threading.Event()
+        self._ready_tasks = set()
+        self._stats = {"detected": 0, "waiting_ready": 0, "timed_out": 0, "extracting": 0, "notified": 0, "dropped_notifications": 0}
+
+    def start(self):
+        self._thread.start()
+        self._started.wait()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        # Queues and semaphores must be created on the loop's own thread
+        self.detect_q = asyncio.Queue(PIPELINE_QUEUE_SIZE)
+        self.extract_q = asyncio.Queue(PIPELINE_QUEUE_SIZE)
+        self.notify_q = asyncio.Queue(NOTIFY_QUEUE_SIZE)
+        self._ready_slots = asyncio.Semaphore(READY_CONCURRENCY)
+        self._extract_slots = asyncio.Semaphore(PIPELINE_MAX_SCHEDULED)
+        stages = [
+            self.loop.create_task(self._detect_stage()),
+            self.loop.create_task(self._extract_stage()),
+            self.loop.create_task(self._notify_stage()),
+        ]
+        self._started.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            tasks = stages + list(self._ready_tasks)
+            for task in tasks:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.close()
+
+    # --- entry points (any thread) ---
+
+    def submit(self, path: Path):
+        """Blocks the caller while the detect queue is full (backpressure)"""
+        future = asyncio.run_coroutine_threadsafe(self.detect_q.put(path), self.loop)
+        future.result()
+
+    def notify(self, fn, *args):
+        def enqueue():
+            try:
+                self.notify_q.put_nowait((fn, args))
+            except asyncio.QueueFull:
+                # Never hold extraction back for a toast
+                self._stats["dropped_notifications"] += 1
+        try:
+            self.loop.call_soon_threadsafe(enqueue)
+        except RuntimeError:
+            pass  # loop closed during shutdown
+
+    # --- stages ---
+
+    async def _detect_stage(self):
+        while True:
+            path = await self.detect_q.get()
+            self._stats["detected"] += 1
+            await self._ready_slots.acquire()
+            task = self.loop.create_task(self._ready_stage(path))
+            self._ready_tasks.add(task)
+            task.add_done_callback(self._ready_tasks.discard)
+
+    async def _wait_ready(self, path: Path, stable_seconds: float = 2.0, timeout: float = READY_IDLE_TIMEOUT) -> bool:
+        source = await self.loop.run_in_executor(self._probe_executor, download_source, path)
+        learned = await self.loop.run_in_executor(self._probe_executor, READINESS_STATS.get, source)
+        tracker = ReadinessTracker(stable_seconds, timeout, learned)
+        try:
+            while not tracker.expired(time.time()):
+                sample = await self.loop.run_in_executor(self._probe_executor, _readiness_sample, path)
+                ready, delay = tracker.update(sample, time.time())
+                if ready:
+                    return True
+                await asyncio.sleep(delay)
+            return False
+        finally:
+            try:
+                self.loop.run_in_executor(self._probe_executor, READINESS_STATS.record, source, tracker)
+            except RuntimeError:
+                pass  # shutting down
+
+    async def _ready_stage(self, path: Path):
+        self._stats["waiting_ready"] += 1
+        try:
+            if not await self._wait_ready(path):
+                self._stats["timed_out"] += 1
+                raise TimeoutError(f"{t('zip_error_locked')}: {path.name}")
+            await self.extract_q.put(path)
+        except Exception as e:
+            self.handler._report_failure(path, e)
+            self.handler._finished(path)
+        finally:
+            self._stats["waiting_ready"] -= 1
+            self._ready_slots.release()
+
+    async def _extract_stage(self):
+        while True:
+            path = await self.extract_q.get()
+            await self._extract_slots.acquire()
+            cost = await self.loop.run_in_executor(self._probe_executor, estimate_job_cost, path)
+            if self.scheduler.submit(path, cost, partial(self._run_extraction, path)):
+                self._stats["extracting"] += 1
+            else:
+                self._extract_slots.release()
+                self.handler._finished(path)
+
+    def _run_extraction(self, path: Path):
+        # On a scheduler worker thread
+        try:
+            self.handler._process(path, True)
+        finally:
+            try:
+                self.loop.call_soon_threadsafe(self._extraction_done)
+            except RuntimeError:
+                pass
+
+    def _extraction_done(self):
+        self._stats["extracting"] -= 1
+        self._extract_slots.release()
+
+    async def _notify_stage(self):
+        while True:
+            fn, args = await self.notify_q.get()
+            try:
+                await self.loop.run_in_executor(self._notify_executor, fn, *args)
+                self._stats["notified"] += 1
+            except Exception as e:
+                logging.warning("Notification failed: %s", e)
+
+    def stats(self) -> dict:
+        stats = dict(self._stats)
+        stats.update({
+            "detect_queue": self.detect_q.qsize(),
+            "extract_queue": self.extract_q.qsize(),
+            "notify_queue": self.notify_q.qsize(),
+        })
+        return stats
+
+    def stop(self):
+        try:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        except RuntimeError:
+            pass
+        self._thread.join(timeout=5)
+        self._probe_executor.shutdown(wait=False)
+        self._notify_executor.shutdown(wait=False)
+
+# =========================
+# Event coalescing
+# =========================
+
+COALESCE_WINDOW = 0.5  # seconds a path must stay quiet before it becomes a candidate
+
+def _is_archive_part(name: str) -> bool:
+    """x.zip and the parts of split archives (x.zip.001, x.zip.002, x.z01, ...)"""
+    if name.endswith(".zip"):
+        return True
+    base, ext = os.path.splitext(name)
+    if len(ext) < 3 or not ext[-1].isdigit():
+        return False
+    return (ext[1:].isdigit() and base.endswith(".zip")) or (ext[1] == "z" and ext[2:].isdigit())
+
+def _is_zip_like(path: str) -> bool:
+    """Archives, split parts and their in-progress download files (x.zip.crdownload, x.z01.part)"""
+    name = path.lower()
+    if name.endswith(".zip"):
+        return True
+    # Cheap substring test first: this runs for every entry of a polled folder
+    if ".z" not in name:
+        return False
+    if _is_archive_part(name):
+        return True
+    base, ext = os.path.splitext(name)
+    return ext in INCOMPLETE_EXTS and _is_archive_part(base)
+
+class EventCoalescer(FileSystemEventHandler):
+    """
+    Sits between watchdog and ZipHandler: merges the created/modified/moved storm of a
+    download into exactly one candidate event per archive. A path is emitted once it has
+    been quiet for COALESCE_WINDOW; renames carry the pending entry to the new name
+    (x.zip.crdownload -> x.zip), deletions drop it. Only a chain with a created or moved
+    event is emitted: modified/closed alone (an existing archive touched or re-saved)
+    just extend the quiet window.
+    """
+
+    def __init__(self, sink, window: float = COALESCE_WINDOW):
+        self.sink = sink
+        self.window = window
+        self._cond = threading.Condition()
+        self._pending = {}  # path -> {"due", "events", "chain", "new"}
+        self._stopping = False
+        self._stats = {"raw": 0, "emitted": 0, "collapsed": 0, "dropped": 0, "renames": 0}
+        self._thread = threading.Thread(target=self._run, name="unzip-coalesce", daemon=True)
+        self._thread.start()
+
+    def on_any_event(self, event):
+        kind = event.event_type
+        if event.is_directory or kind not in ("created", "modified", "moved", "deleted", "closed"):
+            return
+        src = event.src_path
+        dest = event.dest_path if kind == "moved" else None
+        if not (_is_zip_like(src) or (dest is not None and _is_zip_like(dest))):
+            return
+
+        now = time.monotonic()
+        with self._cond:
+            self._stats["raw"] += 1
+            if kind == "deleted":
+                entry = self._pending.pop(src, None)
+                if entry is not None:
+                    self._stats["dropped"] += entry["events"] + 1
+                else:
+                    self._stats["dropped"] += 1
+                return
+            if dest is not None:
+                # Rename chain: the download's history follows the file to its final name
+                entry = self._pending.pop(src, None) or {"events": 0, "chain": [src], "new": False}
+                entry["chain"].append(dest)
+                entry["new"] = True
+                previous = self._pending.get(dest)
+                if previous is not None:
+                    entry["events"] += previous["events"]
+                self._stats["renames"] += 1
+                key = dest
+            else:
+                key = src
+                entry = self._pending.get(key) or {"events": 0, "chain": [src], "new": False}
+                if kind == "created":
+                    entry["new"] = True
+            entry["events"] += 1
+            entry["due"] = now + self.window
+            self._pending[key] = entry
+            self._cond.notify_all()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopping:
+                        return
+                    if not self._pending:
+                        self._cond.wait()
+                        continue
+                    now = time.monotonic()
+                    next_due = min(e["due"] for e in self._pending.values())
+                    if next_due <= now:
+                        break
+                    self._cond.wait(next_due - now)
+                due = [(k, e) for k, e in self._pending.items() if e["due"] <= now]
+                for key, entry in due:
+                    del self._pending[key]
+                    if entry["new"] and _is_archive_part(key.lower()):
+                        self._stats["emitted"] += 1
+                        self._stats["collapsed"] += entry["events"] - 1
+                    else:
+                        self._stats["dropped"] += entry["events"]
+            for key, entry in due:
+                if not (entry["new"] and _is_archive_part(key.lower())):
+                    continue
+                if len(entry["chain"]) > 1:
+                    logging.debug("Rename chain: %s", " -> ".join(Path(p).name for p in entry["chain"]))
+                try:
+                    self.sink(Path(key))
+                except Exception as e:
+                    logging.exception("Candidate handling failed for %s: %s", key, e)
+
+    def stats(self) -> dict:
+        with self._cond:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._pending)
+        return stats
+
+    def stop(self):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join(timeout=2)
+        stats = self.stats()
+        logging.info("Event coalescing: %d raw events -> %d candidates (%d collapsed, %d dropped)",
+                     stats["raw"], stats["emitted"], stats["collapsed"], stats["dropped"])
 
 class ZipHandler(FileSystemEventHandler):
-    def __init__(self, max_recent=1000):
+    def __init__(self, max_recent=1000, scheduler: "JobScheduler" = None, deleter: "DeletionService" = None, journal: JobJournal = None):
         self._recent = {}
+        self._recent_lock = threading.Lock()
+        # Archives between detection and the end of their job; parts of a split archive
+        # keep re-triggering their first part while the set downloads
+        self._active = set()
         self.max_recent = max_recent
+        # Without a scheduler archives are processed inline on the observer thread
+        self.scheduler = scheduler
+        # Without a deletion service archives are deleted synchronously
+        self.deleter = deleter
+        # Without a journal a crash leaves no record of the jobs it interrupted
+        self.journal = journal
+        # Set by run_watcher: readiness waits, extraction and notifications then go through
+        # the asyncio pipeline; without it everything runs inline on the calling thread
+        self.pipeline = None
 
     def on_created(self, event):
         if event.is_directory:
@@ -960,8 +3136,11 @@ class ZipHandler(FileSystemEventHandler):
             self._recent = {p: t for p, t in self._recent.items() if t > oldest}
 
     def _maybe_process(self, path: Path):
-        if path.suffix.lower() != ".zip":
-            return
+        if not is_archive_name(path.name):
+            # Any part of a split archive stands for the whole set
+            path = split_part_primary(path)
+            if path is None or not path.exists():
+                return
         
         # SECURITY: Reject symlinks to prevent processing wrong files
         if path.is_symlink():
@@ -970,134 +3149,876 @@ class ZipHandler(FileSystemEventHandler):
 
         now = time.time()
         
-        # Clean up old entries periodically
-        if len(self._recent) > 100:  # Cleanup when reaching 100 entries
-            self._cleanup_old_entries(now)
-        
-        if path in self._recent and (now - self._recent[path]) < 5:
-            return
-        self._recent[path] = now
+        # Candidates arrive from the coalescer and the control channel threads
+        with self._recent_lock:
+            # Clean up old entries periodically
+            if len(self._recent) > 100:  # Cleanup when reaching 100 entries
+                self._cleanup_old_entries(now)
+            
+            if path in self._active or (path in self._recent and (now - self._recent[path]) < 5):
+                return
+            self._recent[path] = now
+            self._active.add(path)
 
         logging.info("Zip detected: %s", path.name)
+        self._journal(path, "queued")
+
+        if self.pipeline is not None:
+            self.pipeline.submit(path)
+        else:
+            self._process(path)
 
+    def _notify(self, fn, *args):
+        """Toasts can be slow, the pipeline sends them from its own stage"""
+        if self.pipeline is not None:
+            self.pipeline.notify(fn, *args)
+        else:
+            fn(*args)
+
+    def _process(self, path: Path, ready: bool = False):
         try:
-            if not is_zip_ready(path):
-                raise TimeoutError(f"{t('zip_error_locked')}: {path.name}")
+            self._extract_job(path, ready)
+        except Exception as e:
+            self._report_failure(path, e)
+        finally:
+            self._finished(path)
+
+    def _finished(self, path: Path):
+        with self._recent_lock:
+            self._active.discard(path)
+
+    def _journal(self, path: Path, state: str, **detail):
+        if self.journal is not None:
+            self.journal.record(path, state, **detail)
+
+    def _report_failure(self, path: Path, e: Exception):
+        self._journal(path, "cancelled" if isinstance(e, ExtractionCancelled) else "failed", error=type(e).__name__)
+        if isinstance(e, ExtractionCancelled):
+            logging.info("Extraction interrupted, will resume on next start: %s", path.name)
+        elif isinstance(e, zipfile.BadZipFile):
+            logging.exception("Invalid ZIP file: %s", path.name)
+            self._notify(notify_error, t("zip_invalid"), t("zip_invalid_message"))
+        elif isinstance(e, DiskSpaceError):
+            logging.error("Not enough disk space for %s: %s", path.name, e)
+            self._notify(notify_error, t("zip_error"), t("zip_error_disk_space"))
+        else:
+            # Log detailed error for debugging, but show generic message to user
+            logging.exception("ZIP processing failed for %s: %s", path.name, e)
+            self._notify(notify_error, t("zip_error"), t("zip_error_generic_message"))
+
+    def _extract_job(self, path: Path, ready: bool = False):
+        if not ready and not is_zip_ready(path):
+            raise TimeoutError(f"{t('zip_error_locked')}: {path.name}")
 
-            extract_dir = path.parent / path.stem if EXTRACT_IN_SUBFOLDER else path.parent
+        extract_dir = watcher_extract_dir(path)
+        
+        # Validate extraction directory is under Downloads
+        try:
+            extract_dir_resolved = extract_dir.resolve()
+            downloads_resolved = DOWNLOADS.resolve()
             
-            # Validate extraction directory is under Downloads
+            if not str(extract_dir_resolved).lower().startswith(str(downloads_resolved).lower()):
+                logging.error("Extraction directory outside Downloads: %s", extract_dir.name)
+                # Never resumable: don't bring the same error back on every launch
+                checkpoint_path_for(path, extract_dir).unlink(missing_ok=True)
+                self._journal(path, "failed", error="dest")
+                self._notify(notify_error, t("zip_error"), t("zip_error_generic_message"))
+                return
+        except Exception as e:
+            logging.error("Could not validate extraction directory: %s", e)
+            self._journal(path, "failed", error="dest")
+            self._notify(notify_error, t("zip_error"), t("zip_error_generic_message"))
+            return
+        
+        logging.info("Extraction directory: %s", extract_dir.name)
+        parts = split_archive_parts(path) or [path]
+        # "fresh": the folder did not exist before this job, so a crash may roll it back whole
+        self._journal(path, "extracting", dest=str(extract_dir), fresh=not extract_dir.exists())
+
+        try:
+            started = time.time()
+            cancel = self.scheduler.cancel_event if self.scheduler is not None else None
+            verified = set()
+            entries = safe_extract(path, extract_dir, cancel=cancel, checkpoint=True, verified=verified, sync=DELETE_ZIP)
+        except ExtractionCancelled:
+            # Keep the partial folder: the checkpoint refers to it
+            raise
+        except Exception as e:
+            # SECURITY: Clean up partial extraction on failure
             try:
-                extract_dir_resolved = extract_dir.resolve()
-                downloads_resolved = DOWNLOADS.resolve()
-                
-                if not str(extract_dir_resolved).lower().startswith(str(downloads_resolved).lower()):
-                    logging.error("Extraction directory outside Downloads: %s", extract_dir.name)
-                    notify_error(t("zip_error"), t("zip_error_generic_message"))
-                    return
+                if extract_dir.exists() and extract_dir.parent == DOWNLOADS:
+                    logging.info("Removing partial extraction: %s", extract_dir)
+                    shutil.rmtree(extract_dir, ignore_errors=True)
+            except Exception:
+                pass
+            raise e
+        
+        logging.info("Extraction OK: %s", path.name)
+
+        if WRITE_MANIFEST:
+            try:
+                write_manifest(path, extract_dir, entries, started, time.time())
             except Exception as e:
-                logging.error("Could not validate extraction directory: %s", e)
-                notify_error(t("zip_error"), t("zip_error_generic_message"))
+                logging.warning("Failed to write extraction manifest for %s: %s", path.name, e)
+
+        if DELETE_ZIP and VERIFY_BEFORE_DELETE:
+            t0 = time.perf_counter()
+            files = [e for e in entries if not e["dir"]]
+            reread = [e for e in files if e["path"] not in verified]
+            mismatches = verify_entries(extract_dir, entries, skip_crc=verified)
+            logging.info(
+                "Verified %s: %d files, %d re-read (%.1f MB) in %.2fs",
+                path.name, len(files), len(reread), sum(e["size"] for e in reread) / 1e6, time.perf_counter() - t0,
+            )
+            if mismatches:
+                # Keep the archive, it is the only good copy
+                logging.error("Verification failed for %s, archive kept (%d mismatches, first: %s)", path.name, len(mismatches), mismatches[0])
+                self._journal(path, "failed", error="verify")
+                self._notify(notify_error, t("zip_error"), t("zip_error_generic_message"))
                 return
-            
-            logging.info("Extraction directory: %s", extract_dir.name)
 
+        self._journal(path, "extracted", dest=str(extract_dir))
+        self._delete_parts(path, parts)
+        self._notify(notify_success_extract, path.name)
+
+    def _delete_parts(self, path: Path, parts: list):
+        """Delete the archive (every part of a split set); the job is done once the primary is gone"""
+        if not DELETE_ZIP:
+            self._journal(path, "done", deleted=False)
+            return
+        for part in parts:
+            if self.deleter is not None:
+                on_done = partial(self._deleted, path) if part == path else None
+                if not self.deleter.submit(part, on_done) and on_done is not None:
+                    self._deleted(path, False)
+            elif robust_delete(part):
+                logging.info("Archive deleted: %s", part.name)
+        if self.deleter is None:
+            self._journal(path, "done", deleted=not path.exists())
+
+    def _deleted(self, path: Path, deleted: bool):
+        self._journal(path, "done", deleted=deleted)
+
+    def recover_from_journal(self):
+        """
+        Finish what the previous session left unfinished, without rescanning Downloads:
+        jobs that had extracted only get their archive deleted, interrupted extractions
+        resume from their checkpoint or are rolled back and redone, queued ones are resubmitted.
+        """
+        if self.journal is None:
+            return
+        try:
+            unfinished = self.journal.unfinished()
+        except sqlite3.Error as e:
+            logging.warning("Could not replay job journal: %s", e)
+            return
+        for path, state, detail in unfinished:
+            if state == "extracted":
+                logging.info("Completing interrupted job (already extracted): %s", path.name)
+                parts = [p for p in split_archive_parts(path) or [path] if p.exists()]
+                if path in parts:
+                    self._delete_parts(path, parts)
+                else:
+                    # The primary is gone: nothing left to do, stray parts are not ours to guess about
+                    self._journal(path, "done", deleted=True)
+                continue
+            if not path.exists():
+                # Output may well be complete (deleted by hand after extraction): keep it
+                logging.info("Archive of interrupted job no longer exists: %s", path.name)
+                self._journal(path, "failed", error="missing")
+                continue
+            if state in ("extracting", "cancelled") and detail.get("dest"):
+                dest = Path(detail["dest"])
+                header, _ = _read_checkpoint(checkpoint_path_for(path, dest))
+                try:
+                    resumable = header is not None and header == _archive_identity(path, dest)
+                except OSError:
+                    resumable = False
+                if resumable:
+                    logging.info("Resuming interrupted extraction: %s", path.name)
+                # SECURITY: Only ever remove a folder this job created, directly under Downloads
+                elif detail.get("fresh") and dest.exists() and dest.parent == DOWNLOADS:
+                    logging.info("Rolling back partial extraction: %s", dest)
+                    shutil.rmtree(dest, ignore_errors=True)
+            else:
+                logging.info("Resubmitting queued archive: %s", path.name)
+            self._maybe_process(path)
+
+# =========================
+# Local control channel (IPC)
+# =========================
+
+CONTROL_KEY_FILE = INSTALL_DIR / "control.key"
+if IS_WINDOWS:
+    CONTROL_ADDRESS = rf"\\.\pipe\{APP_NAME}_Control_{os.getenv('USERNAME', '')}"
+else:
+    CONTROL_ADDRESS = str(INSTALL_DIR / "control.sock")
+CONTROL_MAX_MESSAGE = 1024 * 1024
+
+def _load_or_create_control_key() -> bytes:
+    """Per-install random secret; only processes of the same user can read it"""
+    try:
+        key = CONTROL_KEY_FILE.read_bytes()
+        if len(key) >= 32:
+            return key
+    except OSError:
+        pass
+    INSTALL_DIR.mkdir(parents=True, exist_ok=True)
+    key = secrets.token_hex(32).encode("ascii")
+    fd = os.open(CONTROL_KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    _restrict_file_permissions(CONTROL_KEY_FILE)
+    return key
+
+def _submitted_archive_error(path: Path):
+    """Reason a submitted path is refused, or None"""
+    if not is_archive_name(path.name):
+        return "not a .zip file"
+    if path.is_symlink():
+        return "symlink"
+    if not path.is_file():
+        return "not found"
+    # SECURITY: same boundary as the watcher, extraction only happens under Downloads
+    if not is_within_directory(DOWNLOADS, path):
+        return "outside Downloads"
+    return None
+
+class ControlServer:
+    """
+    Local control API: named pipe on Windows, Unix socket elsewhere. Clients authenticate
+    with the key in CONTROL_KEY_FILE (HMAC challenge); requests and replies are JSON objects.
+    Commands: submit {"paths": [...]}, status, pause, resume, metrics.
+    """
+
+    def __init__(self, submit, scheduler: JobScheduler, metrics: dict):
+        self.submit = submit
+        self.scheduler = scheduler
+        self.metrics = metrics
+        self.started = time.time()
+        self._listener = None
+        self._key = None
+        self._stopping = False
+        self._thread = None
+
+    def start(self):
+        self._key = _load_or_create_control_key()
+        if not IS_WINDOWS:
+            # Stale socket from a crashed instance (we hold the single-instance lock)
+            Path(CONTROL_ADDRESS).unlink(missing_ok=True)
+        self._listener = Listener(CONTROL_ADDRESS, authkey=self._key)
+        if not IS_WINDOWS:
+            os.chmod(CONTROL_ADDRESS, 0o600)
+        self._thread = threading.Thread(target=self._serve, name="unzip-control", daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        while not self._stopping:
+            try:
+                conn = self._listener.accept()
+            except AuthenticationError:
+                logging.warning("Control channel: client failed authentication")
+                continue
+            except Exception as e:
+                if self._stopping:
+                    return
+                logging.warning("Control channel accept failed: %s", e)
+                time.sleep(0.1)
+                continue
+            threading.Thread(target=self._handle_connection, args=(conn,), daemon=True).start()
+
+    def _handle_connection(self, conn):
+        with conn:
             try:
-                safe_extract(path, extract_dir)
+                request = json.loads(conn.recv_bytes(CONTROL_MAX_MESSAGE).decode("utf-8"))
+                reply = self.handle(request if isinstance(request, dict) else {})
             except Exception as e:
-                # SECURITY: Clean up partial extraction on failure
+                reply = {"ok": False, "error": str(e)}
+            try:
+                conn.send_bytes(json.dumps(reply, ensure_ascii=False).encode("utf-8"))
+            except OSError:
+                pass
+
+    def handle(self, request: dict) -> dict:
+        cmd = request.get("cmd")
+        if cmd == "submit":
+            accepted, rejected = [], {}
+            for raw in request.get("paths") or []:
+                path = Path(str(raw))
+                error = _submitted_archive_error(path)
+                if error:
+                    rejected[str(raw)] = error
+                    continue
+                self.submit(path)
+                accepted.append(str(path))
+            logging.info("Control channel: %d archive(s) submitted, %d rejected", len(accepted), len(rejected))
+            return {"ok": True, "accepted": accepted, "rejected": rejected}
+        if cmd == "status":
+            return {"ok": True, "uptime": round(time.time() - self.started, 1), **self.scheduler.stats()}
+        if cmd == "pause":
+            self.scheduler.pause()
+            logging.info("Control channel: processing paused")
+            return {"ok": True, "paused": True}
+        if cmd == "resume":
+            self.scheduler.resume()
+            logging.info("Control channel: processing resumed")
+            return {"ok": True, "paused": False}
+        if cmd == "metrics":
+            return {"ok": True, **{name: fn() for name, fn in self.metrics.items()}}
+        return {"ok": False, "error": f"unknown command: {cmd}"}
+
+    def stop(self):
+        self._stopping = True
+        # Wake the blocking accept() with a throwaway connection
+        try:
+            Client(CONTROL_ADDRESS, authkey=self._key).close()
+        except Exception:
+            pass
+        try:
+            self._listener.close()
+        except Exception:
+            pass
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+def send_control_command(cmd: str, **params) -> dict:
+    """Client side of the control channel, for other local tools"""
+    key = CONTROL_KEY_FILE.read_bytes()
+    with Client(CONTROL_ADDRESS, authkey=key) as conn:
+        conn.send_bytes(json.dumps({"cmd": cmd, **params}, ensure_ascii=False).encode("utf-8"))
+        return json.loads(conn.recv_bytes(CONTROL_MAX_MESSAGE).decode("utf-8"))
+
+# =========================
+# Observer supervision
+# =========================
+
+POLL_INTERVAL_MIN = 1.0
+POLL_INTERVAL_MAX = 30.0  # reached after ~10 idle polls
+NETWORK_FS_TYPES = {"cifs", "smb3", "smbfs", "nfs", "nfs4", "9p", "davfs", "afpfs", "ncpfs"}
+
+def _is_network_folder(folder: Path) -> bool:
+    """Native change notifications are unreliable on SMB/NFS shares and FUSE mounts"""
+    if IS_WINDOWS:
+        if str(folder).startswith("\\\\"):
+            return True
+        try:
+            DRIVE_REMOTE = 4
+            root = os.path.splitdrive(str(folder.resolve()))[0] + "\\"
+            return kernel32.GetDriveTypeW(root) == DRIVE_REMOTE
+        except Exception:
+            return False
+    try:
+        resolved = str(folder.resolve())
+        best, fstype = "", ""
+        with open("/proc/self/mounts", "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) < 3:
+                    continue
+                mount = parts[1].replace("\\040", " ")
+                inside = resolved == mount or resolved.startswith(mount.rstrip("/") + "/")
+                if inside and len(mount) > len(best):
+                    best, fstype = mount, parts[2]
+        return fstype in NETWORK_FS_TYPES or fstype.startswith("fuse.")
+    except OSError:
+        return False
+
+class ScandirPoller:
+    """
+    Polling observer for folders where native notifications are unreliable. Keeps an
+    (inode, size, mtime) snapshot of zip-like entries only, rescans with a single
+    os.scandir pass (other names are skipped without a stat call), detects renames by
+    inode, and backs its interval off from POLL_INTERVAL_MIN to POLL_INTERVAL_MAX while
+    nothing changes. Same interface as a watchdog observer.
+    """
+
+    def __init__(self, min_interval: float = POLL_INTERVAL_MIN, max_interval: float = POLL_INTERVAL_MAX):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.scans = 0
+        self._watches = []  # [handler, folder, snapshot]
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="unzip-poller", daemon=True)
+
+    def schedule(self, event_handler, path: str, recursive: bool = False):
+        self._watches.append([event_handler, path, {}])
+
+    def start(self):
+        for watch in self._watches:
+            watch[2] = self._snapshot(watch[1])
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def join(self, timeout=None):
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    @staticmethod
+    def _snapshot(folder: str) -> dict:
+        snap = {}
+        with os.scandir(folder) as it:
+            for entry in it:
+                if not _is_zip_like(entry.name):
+                    continue
                 try:
-                    if extract_dir.exists() and extract_dir.parent == DOWNLOADS:
-                        logging.info("Removing partial extraction: %s", extract_dir)
-                        shutil.rmtree(extract_dir, ignore_errors=True)
-                except Exception:
-                    pass
-                raise e
-            
-            logging.info("Extraction OK: %s", path.name)
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                    snap[entry.name] = (entry.inode(), st.st_size, st.st_mtime_ns)
+                except OSError:
+                    continue  # vanished between listing and stat
+        return snap
+
+    def _poll(self, watch) -> bool:
+        handler, folder, old = watch
+        new = self._snapshot(folder)
+        self.scans += 1
+        if new == old:
+            return False
+        created = sorted(new.keys() - old.keys())
+        deleted = set(old.keys() - new.keys())
+        by_inode = {old[name][0]: name for name in deleted if old[name][0]}
+        events = []
+        for name in created:
+            src = by_inode.pop(new[name][0], None) if new[name][0] else None
+            if src is not None:
+                deleted.discard(src)
+                events.append(FileMovedEvent(os.path.join(folder, src), os.path.join(folder, name)))
+            else:
+                events.append(FileCreatedEvent(os.path.join(folder, name)))
+        for name in sorted(deleted):
+            events.append(FileDeletedEvent(os.path.join(folder, name)))
+        for name in new.keys() & old.keys():
+            if new[name] != old[name]:
+                events.append(FileModifiedEvent(os.path.join(folder, name)))
+        watch[2] = new
+        for event in events:
+            handler.dispatch(event)
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            changed = False
+            for watch in self._watches:
+                try:
+                    changed = self._poll(watch) or changed
+                except OSError as e:
+                    # Share temporarily unreachable: keep the old snapshot and retry
+                    logging.warning("Polling %s failed: %s", watch[1], e)
+            self.interval = self.min_interval if changed else min(self.interval * 1.5, self.max_interval)
+
+OBSERVER_BACKOFF_START = 1.0
+OBSERVER_BACKOFF_MAX = 60.0
+OBSERVER_STABLE_SECONDS = 300.0  # alive this long -> failure count is reset
+OBSERVER_MAX_NATIVE_FAILURES = 5  # then fall back to polling instead of giving up
+
+class ObserverSupervisor:
+    """
+    Keeps the watched folder covered. A dead observer is restarted with exponential backoff
+    around the same event handler (its dedupe state survives), and the folder is rescanned for
+    archives written while nothing was watching. Repeated native failures switch to the
+    scandir poller rather than leaving the folder unwatched.
+    """
 
-            if DELETE_ZIP:
-                robust_delete(path)
-                logging.info("Archive deleted: %s", path.name)
+    def __init__(self, event_handler, on_candidate, folder: Path):
+        self.event_handler = event_handler
+        self.on_candidate = on_candidate
+        self.folder = folder
+        self.observer = None
+        self.polling = MONITOR_MODE == "polling" or (MONITOR_MODE == "auto" and _is_network_folder(folder))
+        self.failures = 0
+        self.restarts = 0
+        self.rescanned = 0
+        self._last_alive = time.time()
+        self._alive_since = time.time()
+        self._next_attempt = 0.0
+        self._down_since = None
+
+    def _start_observer(self):
+        observer = ScandirPoller() if self.polling else Observer()
+        observer.schedule(self.event_handler, str(self.folder), recursive=False)
+        observer.start()
+        self.observer = observer
+        self._alive_since = self._last_alive = time.time()
+
+    def start(self):
+        self._start_observer()
+        if self.polling:
+            logging.info("Monitoring %s by polling", self.folder)
+
+    def check(self):
+        """Call periodically; cheap when the observer is healthy"""
+        now = time.time()
+        if self.observer is not None and self.observer.is_alive():
+            self._last_alive = now
+            if self.failures and now - self._alive_since > OBSERVER_STABLE_SECONDS:
+                self.failures = 0
+            return
 
-            notify_success_extract(path.name)
+        if self._down_since is None:
+            self._down_since = self._last_alive
+            self.failures += 1
+            delay = min(OBSERVER_BACKOFF_START * 2 ** (self.failures - 1), OBSERVER_BACKOFF_MAX)
+            self._next_attempt = now + delay
+            logging.warning("Observer thread died (failure %d) - restarting in %.0fs", self.failures, delay)
+            try:
+                self.observer.stop()
+                self.observer.join(timeout=2)
+            except Exception:
+                pass
+            self.observer = None
+        if now < self._next_attempt:
+            return
 
-        except zipfile.BadZipFile:
-            logging.exception("Invalid ZIP file: %s", path.name)
-            notify_error(t("zip_invalid"), t("zip_invalid_message"))
+        if not self.polling and self.failures > OBSERVER_MAX_NATIVE_FAILURES:
+            logging.error("Native observer failed %d times - switching to polling", self.failures)
+            self.polling = True
+        try:
+            self._start_observer()
         except Exception as e:
-            # Log detailed error for debugging, but show generic message to user
-            logging.exception("ZIP processing failed for %s: %s", path.name, e)
-            notify_error(t("zip_error"), t("zip_error_generic_message"))
+            logging.warning("Observer restart failed: %s", e)
+            self.failures += 1
+            self._next_attempt = now + min(OBSERVER_BACKOFF_START * 2 ** (self.failures - 1), OBSERVER_BACKOFF_MAX)
+            return
+        self.restarts += 1
+        # Mtime granularity (2s on FAT) + clock slack
+        self._rescan(since=self._down_since - 2.0)
+        self._down_since = None
+        logging.info("Observer restarted successfully%s", " (polling)" if self.polling else "")
+
+    def _rescan(self, since: float):
+        """Targeted scan: only archives created/modified during the outage"""
+        found = 0
+        try:
+            with os.scandir(self.folder) as it:
+                for entry in it:
+                    if not _is_archive_part(entry.name.lower()) or not entry.is_file(follow_symlinks=False):
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                    # ctime: creation on Windows, rename/metadata change on POSIX
+                    if max(st.st_mtime, st.st_ctime) >= since:
+                        found += 1
+                        self.on_candidate(Path(entry.path))
+        except OSError as e:
+            logging.warning("Gap rescan failed: %s", e)
+        self.rescanned += found
+        if found:
+            logging.info("Gap rescan: %d archive(s) arrived during observer outage", found)
+
+    def stats(self) -> dict:
+        return {
+            "alive": self.observer is not None and self.observer.is_alive(),
+            "polling": self.polling,
+            "failures": self.failures,
+            "restarts": self.restarts,
+            "rescanned": self.rescanned,
+        }
+
+    def stop(self):
+        if self.observer is None:
+            return
+        try:
+            self.observer.stop()
+            self.observer.join(timeout=5)
+        except Exception:
+            pass
 
 # =========================
 # Main
 # =========================
 
 def run_watcher():
+    # Resolve the language and load its catalog before events start arriving
+    get_translator()
+
     if not MONITOR_FOLDER.exists():
         msg = f"{t('watch_error_folder_not_found')}: {MONITOR_FOLDER.name}"
         logging.error(msg)
         notify_error(t("watch_error_config"), msg)
         return
 
-    # ✅ Mutex uniquement pour l'instance installée (watcher)
-    if _is_running_from_install_dir():
+    # ✅ Mutex uniquement pour l'instance installée (watcher); no installer on POSIX, always enforced
+    if _is_running_from_install_dir() or not IS_WINDOWS:
         ensure_single_instance_or_exit()
 
-    shutdown_event = create_shutdown_event()
+    shutdown_signal = create_shutdown_event()
+
+    # Shared across observer restarts so queued jobs survive them
+    scheduler = JobScheduler()
+    deleter = DeletionService()
+    journal = open_job_journal()
+    pruned = prune_manifests()
+    if pruned:
+        logging.info("Manifests pruned: %d expired or orphaned", pruned)
+    handler = ZipHandler(scheduler=scheduler, deleter=deleter, journal=journal)
+    pipeline = AsyncPipeline(handler, scheduler)
+    handler.pipeline = pipeline
+    pipeline.start()
+    coalescer = EventCoalescer(handler._maybe_process)
+    supervisor = ObserverSupervisor(coalescer, handler._maybe_process, MONITOR_FOLDER)
+    supervisor.start()
+    metrics = {
+        "pipeline": pipeline.stats,
+        "scheduler": scheduler.stats,
+        "deletions": deleter.stats,
+        "events": coalescer.stats,
+        "observer": supervisor.stats,
+    }
+    if journal is not None:
+        metrics["journal"] = journal.stats
+    load_monitor = None
+    if PRIORITY_MODE == "background":
+        load_monitor = SystemLoadMonitor()
+        load_monitor.start()
+        metrics["load"] = load_monitor.stats
+
+    control = ControlServer(
+        submit=handler._maybe_process,
+        scheduler=scheduler,
+        metrics=metrics,
+    )
+    try:
+        control.start()
+    except Exception as e:
+        logging.warning("Control channel unavailable: %s", e)
+        control = None
 
-    handler = ZipHandler()
-    observer = Observer()
-    observer.schedule(handler, str(MONITOR_FOLDER), recursive=False)
-    observer.start()
+    # Finish jobs interrupted by a crash, shutdown or update; checkpoints without a journal
+    # entry (journal unavailable or older version) are still resumed
+    handler.recover_from_journal()
+    for zip_path in pending_checkpoints(journal):
+        logging.info("Resuming interrupted extraction: %s", zip_path.name)
+        handler._maybe_process(zip_path)
 
     logging.info(t("monitoring_started", MONITOR_FOLDER))
     notify_info(t("app_name"), t("watch_started"))
 
-    restart_count = 0
-    max_restarts = 5  # SECURITY: Prevent infinite restart loops
-    
     try:
         while True:
-            res = _win_wait_for_single_object(shutdown_event, 1000)
-            if res == WAIT_OBJECT_0:
+            if shutdown_signal.wait(1.0):
                 logging.info(t("shutdown_requested"))
                 break
-            
-            # SECURITY: Check if observer is still alive
-            if not observer.is_alive():
-                restart_count += 1
-                if restart_count > max_restarts:
-                    logging.error("Observer crashed %d times - giving up to prevent infinite loop", restart_count)
-                    break
-                
-                logging.warning("Observer thread died (restart %d/%d) - attempting restart", restart_count, max_restarts)
-                try:
-                    observer.stop()
-                    observer.join(timeout=2)
-                except Exception:
-                    pass
-                
-                # SECURITY: Wait before restart to avoid tight loop
-                time.sleep(1.0)
-                
-                # Restart observer
-                handler = ZipHandler()
-                observer = Observer()
-                observer.schedule(handler, str(MONITOR_FOLDER), recursive=False)
-                observer.start()
-                logging.info("Observer restarted successfully")
+            supervisor.check()
     except Exception as e:
         logging.exception("Watcher error: %s", e)
     finally:
+        supervisor.stop()
+        if control is not None:
+            control.stop()
+        coalescer.stop()
+        scheduler.stop()
+        pipeline.stop()
+        deleter.stop()
+        if journal is not None:
+            journal.close()
+        if load_monitor is not None:
+            load_monitor.stop()
+        shutdown_process_pool()
+
+# =========================
+# Batch CLI (headless)
+# =========================
+
+EXIT_OK = 0
+EXIT_FAILURES = 1
+EXIT_USAGE = 2
+EXIT_NO_INPUT = 3
+EXIT_INTERRUPTED = 130
+
+ATTACH_PARENT_PROCESS = 0xFFFFFFFF
+
+def _attach_parent_console():
+    """
+    The frozen exe is a GUI-subsystem binary (no console, sys.stdout is None). In CLI mode,
+    borrow the console of the shell that started it so output and argparse errors show up.
+    """
+    if kernel32 is None or (sys.stdout is not None and sys.stderr is not None):
+        return
+    if not kernel32.AttachConsole(wintypes.DWORD(ATTACH_PARENT_PROCESS)):
+        return  # started from Explorer or a shortcut: nowhere to print
+    try:
+        if sys.stdout is None:
+            sys.stdout = open("CONOUT$", "w", encoding="utf-8", errors="replace")
+        if sys.stderr is None:
+            sys.stderr = open("CONOUT$", "w", encoding="utf-8", errors="replace")
+    except OSError as e:
+        logging.debug("Could not open the parent console: %s", e)
+
+def _cli_print(msg: str):
+    # Still None when the exe was not started from a console
+    if sys.stdout is not None:
+        print(msg, flush=True)
+
+def _expand_archive_args(patterns: list) -> list:
+    """Paths, directories (their *.zip, *.zip.001) and globs -> unique list of .zip files"""
+    found = []
+    seen = set()
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            candidates = [Path(p) for p in sorted(glob.glob(pattern, recursive=True))]
+        elif Path(pattern).is_dir():
+            candidates = sorted(Path(pattern).glob("*.zip")) + sorted(Path(pattern).glob("*.zip.001"))
+        else:
+            candidates = [Path(pattern)]
+        for p in candidates:
+            if not is_archive_name(p.name) or not p.is_file() or p.is_symlink():
+                continue
+            key = str(p.resolve()).lower()
+            if key not in seen:
+                seen.add(key)
+                found.append(p)
+    return found
+
+def _batch_dest_dir(zip_path: Path, dest_root) -> Path:
+    parent = Path(dest_root) if dest_root else zip_path.parent
+    return parent / archive_stem(zip_path) if EXTRACT_IN_SUBFOLDER or dest_root else parent
+
+def _batch_dest_collisions(archives: list, dest_root) -> dict:
+    """{destination folder: archives} for folders more than one archive would be extracted into"""
+    if not (EXTRACT_IN_SUBFOLDER or dest_root):
+        return {}  # everything goes next to its archive on purpose
+    by_dest = {}
+    for zip_path in archives:
+        key = str(_batch_dest_dir(zip_path, dest_root).resolve()).lower()
+        by_dest.setdefault(key, []).append(zip_path)
+    return {dest: paths for dest, paths in by_dest.items() if len(paths) > 1}
+
+def _batch_extract_one(zip_path: Path, dest_root, cancel: threading.Event) -> dict:
+    dest_dir = _batch_dest_dir(zip_path, dest_root)
+    created = not dest_dir.exists()
+    started = time.time()
+    try:
+        entries = safe_extract(zip_path, dest_dir, cancel=cancel, checkpoint=True, checkpoint_dir=BATCH_CHECKPOINT_DIR)
+    except ExtractionCancelled:
+        raise
+    except Exception:
+        if created and dest_dir.exists():
+            shutil.rmtree(dest_dir, ignore_errors=True)
+        raise
+    finished = time.time()
+    if WRITE_MANIFEST:
         try:
-            observer.stop()
-            observer.join(timeout=5)
-        except Exception:
-            pass
+            write_manifest(zip_path, dest_dir, entries, started, finished)
+        except Exception as e:
+            logging.warning("Failed to write extraction manifest for %s: %s", zip_path.name, e)
+    return {
+        "elapsed": finished - started,
+        "members": len(entries),
+        "bytes": sum(e["size"] for e in entries),
+    }
+
+def run_batch_extract(argv: list) -> int:
+    """`extract` subcommand: bulk extraction without watcher, tray or notifications"""
+    parser = argparse.ArgumentParser(prog=f"{APP_NAME} extract", description="Extract existing ZIP archives.")
+    parser.add_argument("paths", nargs="+", help="archives, directories or glob patterns")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 2, help="parallel extractions")
+    parser.add_argument("-d", "--dest", help="extract into DEST/<archive name> instead of next to the archive")
+    parser.add_argument("--background", action="store_true", help="low CPU/I/O priority, slow down while the machine is busy")
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return EXIT_USAGE if e.code else EXIT_OK
+
+    global PRIORITY_MODE
+    if args.background:
+        PRIORITY_MODE = "background"
+
+    archives = _expand_archive_args(args.paths)
+    if not archives:
+        _cli_print("No archive matched.")
+        return EXIT_NO_INPUT
+    collisions = _batch_dest_collisions(archives, args.dest)
+    if collisions:
+        # Merging two archives into one folder (and one checkpoint) is never what was meant
+        for dest, paths in collisions.items():
+            _cli_print(f"Same destination {dest} for: {', '.join(str(p) for p in paths)}")
+        _cli_print("Extract these archives separately or with different --dest folders.")
+        return EXIT_USAGE
+
+    cancel = threading.Event()
+    ok = failed = 0
+    total_bytes = 0
+    wall_start = time.time()
+    pool = ThreadPoolExecutor(max_workers=max(1, args.workers), initializer=apply_worker_priority)
+    load_monitor = SystemLoadMonitor() if PRIORITY_MODE == "background" else None
+    if load_monitor is not None:
+        load_monitor.start()
+    try:
+        futures = {pool.submit(_batch_extract_one, p, args.dest, cancel): p for p in archives}
+        for future in as_completed(futures):
+            zip_path = futures[future]
+            try:
+                res = future.result()
+            except ExtractionCancelled:
+                continue
+            except Exception as e:
+                failed += 1
+                logging.error("Batch extraction failed for %s: %s", zip_path, e)
+                _cli_print(f"FAIL  {zip_path}: {e}")
+                continue
+            ok += 1
+            total_bytes += res["bytes"]
+            logging.info("Batch extraction OK: %s (%.2fs)", zip_path.name, res["elapsed"])
+            _cli_print(f"OK    {res['elapsed']:8.2f}s {res['members']:6d} files {res['bytes'] / 1e6:10.1f} MB  {zip_path}")
+    except KeyboardInterrupt:
+        # Running extractions stop between members and keep their checkpoint
+        cancel.set()
+        for future in futures:
+            future.cancel()
+        pool.shutdown(wait=True)
+        _cli_print("Interrupted, rerun the same command to resume.")
+        return EXIT_INTERRUPTED
+    finally:
+        if load_monitor is not None:
+            load_monitor.stop()
+    pool.shutdown(wait=True)
+
+    wall = time.time() - wall_start
+    rate = total_bytes / wall / 1e6 if wall > 0 else 0.0
+    _cli_print(f"{ok} extracted, {failed} failed, {total_bytes / 1e6:.1f} MB in {wall:.2f}s ({rate:.1f} MB/s)")
+    return EXIT_FAILURES if failed else EXIT_OK
+
+EXIT_NO_INSTANCE = 4
+
+def run_control_client(argv: list) -> int:
+    """`ctl` subcommand: talk to the running watcher through the control channel"""
+    parser = argparse.ArgumentParser(prog=f"{APP_NAME} ctl", description="Control the running watcher.")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    for name in ("status", "pause", "resume", "metrics"):
+        sub.add_parser(name)
+    submit = sub.add_parser("submit")
+    submit.add_argument("paths", nargs="+")
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return EXIT_USAGE if e.code else EXIT_OK
+
+    params = {}
+    if args.cmd == "submit":
+        params["paths"] = [str(Path(p).resolve()) for p in args.paths]
+    try:
+        reply = send_control_command(args.cmd, **params)
+    except (OSError, EOFError, AuthenticationError) as e:
+        _cli_print(f"No running instance reachable: {e}")
+        return EXIT_NO_INSTANCE
+    _cli_print(json.dumps(reply, indent=2, ensure_ascii=False))
+    return EXIT_OK if reply.get("ok") else EXIT_FAILURES
 
 def main():
+    # Batch and control modes have their own strict argument parsers
+    if len(sys.argv) > 1 and sys.argv[1] in ("extract", "ctl"):
+        _attach_parent_console()
+    if len(sys.argv) > 1 and sys.argv[1] == "extract":
+        sys.exit(run_batch_extract(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "ctl":
+        sys.exit(run_control_client(sys.argv[2:]))
+
     # SECURITY: Validate command line arguments - whitelist approach only
     arg = (sys.argv[1].lower().strip() if len(sys.argv) > 1 else "")
     
@@ -1122,4 +4043,6 @@ def main():
     run_watcher()
 
 if __name__ == "__main__":
+    # Required for the process backend in a PyInstaller build
+    multiprocessing.freeze_support()
     main()
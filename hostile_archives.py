@@ -0,0 +1,308 @@
+"""
+Hostile archives against safe_extract, with time and memory budgets.
+
+Every case is generated on the fly and must either be rejected or be extracted without
+writing outside its destination. That must happen within a wall-clock budget and a peak
+tracemalloc budget, so a slowdown in the validation path shows up as a failure.
+
+    python hostile_archives.py              # all cases, exit code 1 if any fails
+    python hostile_archives.py bomb nested  # only cases whose name contains one of the words
+    python hostile_archives.py --keep DIR   # also keep the generated archives in DIR
+"""
+
+import sys
+import time
+import shutil
+import struct
+import zipfile
+import logging
+import argparse
+import tempfile
+import tracemalloc
+import zlib
+from pathlib import Path
+
+import Auto_unzip as au
+
+# Budgets are several times what a laptop needs, so only real regressions trip them
+# (seconds of wall-clock, MB of peak traced allocations)
+CASES = []
+
+
+def case(name: str, seconds: float, megabytes: float, expect: str):
+    """expect: "reject" (safe_extract must raise) or "contain" (may extract, nothing may escape)"""
+    def register(build):
+        CASES.append((name, build, seconds, megabytes, expect))
+        return build
+    return register
+
+
+# =========================
+# Raw ZIP writer
+# =========================
+
+def _raw_zip(path: Path, local: bytes, central: list):
+    """
+    Write local data followed by a central directory of arbitrary entries.
+    central holds (name, offset, crc, compressed, uncompressed, method) tuples; sizes
+    past 32 bits get a ZIP64 extra field, the way a real writer would declare them.
+    """
+    records = []
+    for name, offset, crc, compressed, uncompressed, method in central:
+        encoded = name.encode("utf-8")
+        extra = b""
+        if uncompressed >= 0xFFFFFFFF or compressed >= 0xFFFFFFFF:
+            extra = struct.pack("<HHQQ", 0x0001, 16, uncompressed, compressed)
+            compressed = uncompressed = 0xFFFFFFFF
+        records.append(struct.pack(
+            "<4s6H3L5H2L", b"PK\x01\x02", 45, 45, 0x800, method, 0, 0x21,
+            crc, compressed, uncompressed, len(encoded), len(extra), 0, 0, 0, 0, offset,
+        ) + encoded + extra)
+    directory = b"".join(records)
+    eocd = struct.pack("<4s4H2LH", b"PK\x05\x06", 0, 0, len(central), len(central), len(directory), len(local), 0)
+    path.write_bytes(local + directory + eocd)
+
+
+def _local_header(name: str, crc: int, compressed: int, uncompressed: int, method: int) -> bytes:
+    encoded = name.encode("utf-8")
+    return struct.pack(
+        "<4s5H3L2H", b"PK\x03\x04", 20, 0x800, method, 0, 0x21,
+        crc, compressed, uncompressed, len(encoded), 0,
+    ) + encoded
+
+
+# =========================
+# Corpus
+# =========================
+
+def _kernel(size: int):
+    """Raw deflate stream of size zero bytes and its CRC"""
+    packer = zlib.compressobj(9, zlib.DEFLATED, -15)
+    return packer.compress(bytes(size)) + packer.flush(), zlib.crc32(bytes(size))
+
+
+@case("overlap_bomb", seconds=1.0, megabytes=8, expect="reject")
+def _overlap_bomb(path: Path):
+    # One 16MB deflate kernel (about 16KB compressed) claimed by 1000 entries: 16GB declared,
+    # over the size cap as well as overlapping
+    size = 16 * 1024 * 1024
+    kernel, crc = _kernel(size)
+    local = _local_header("k", crc, len(kernel), size, zipfile.ZIP_DEFLATED) + kernel
+    _raw_zip(path, local, [(f"f{i}", 0, crc, len(kernel), size, zipfile.ZIP_DEFLATED) for i in range(1000)])
+
+
+@case("overlap_bomb_small", seconds=1.0, megabytes=8, expect="reject")
+def _overlap_bomb_small(path: Path):
+    # Same shape, 100 valid entries of 1MB (all named like the one local header): 100MB
+    # declared, well under the size cap, so only the overlap check keeps it off the disk
+    size = 1024 * 1024
+    kernel, crc = _kernel(size)
+    local = _local_header("k", crc, len(kernel), size, zipfile.ZIP_DEFLATED) + kernel
+    _raw_zip(path, local, [("k", 0, crc, len(kernel), size, zipfile.ZIP_DEFLATED) for _ in range(100)])
+
+
+@case("overlap_bomb_quoted", seconds=1.0, megabytes=8, expect="reject")
+def _overlap_bomb_quoted(path: Path):
+    # Every entry has its own local header, but its data runs through the headers of all
+    # the following ones into the shared kernel; 8GB declared
+    size = 8 * 1024 * 1024
+    kernel, crc = _kernel(size)
+    local = b"".join(_local_header(f"q{i}", crc, len(kernel), size, zipfile.ZIP_DEFLATED) for i in range(1000)) + kernel
+    step = len(_local_header("q0", 0, 0, 0, 0))
+    _raw_zip(path, local, [(f"q{i}", 0 if i == 0 else i * step, crc, len(kernel), size, zipfile.ZIP_DEFLATED) for i in range(1000)])
+
+
+@case("overlap_bomb_quoted_small", seconds=1.0, megabytes=8, expect="reject")
+def _overlap_bomb_quoted_small(path: Path):
+    # Fifield's quoted overlap, every entry valid: entry i's deflate stream starts with a
+    # stored block "quoting" the local header of entry i+1, then runs on into entry i+1's
+    # stream, down to a shared 1MB kernel. 100 entries, about 100MB declared.
+    count = 100
+    kernel_size = 1024 * 1024
+    kernel, _ = _kernel(kernel_size)
+    zeros = bytes(kernel_size)
+    # Built from the last entry back: a header holds the CRC and sizes of everything after it
+    headers, entries = [None] * count, [None] * count
+    for i in reversed(range(count)):
+        following = headers[i + 1:]
+        crc = 0
+        for header in following:
+            crc = zlib.crc32(header, crc)
+        crc = zlib.crc32(zeros, crc)
+        compressed = sum(5 + len(header) for header in following) + len(kernel)
+        uncompressed = sum(len(header) for header in following) + kernel_size
+        headers[i] = _local_header(f"q{i}", crc, compressed, uncompressed, zipfile.ZIP_DEFLATED)
+        entries[i] = (f"q{i}", 0, crc, compressed, uncompressed, zipfile.ZIP_DEFLATED)
+    local, central = b"", []
+    for i, header in enumerate(headers):
+        central.append((entries[i][0], len(local), *entries[i][2:]))
+        local += header
+        if i + 1 < count:
+            # Non-final stored block (BFINAL=0, BTYPE=00) whose payload is the next header
+            local += struct.pack("<BHH", 0, len(headers[i + 1]), len(headers[i + 1]) ^ 0xFFFF)
+    _raw_zip(path, local + kernel, central)
+
+
+@case("central_directory_65k", seconds=2.0, megabytes=64, expect="reject")
+def _central_directory_65k(path: Path):
+    # 65535 empty entries: over MAX_FILES, and every one of them parsed by zipfile
+    local = _local_header("e", 0, 0, 0, zipfile.ZIP_STORED)
+    _raw_zip(path, local, [(f"d{i // 1000}/e{i}", 0, 0, 0, 0, zipfile.ZIP_STORED) for i in range(65535)])
+
+
+@case("nested_long_name", seconds=1.0, megabytes=8, expect="reject")
+def _nested_long_name(path: Path):
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("a/" * 5000 + "x", b"x")
+
+
+@case("nested_deep_then_absolute", seconds=3.0, megabytes=12, expect="reject")
+def _nested_deep_then_absolute(path: Path):
+    # 2000 legal 120-level paths have to be checked before the bad last entry is reached
+    deep = "n/" * 120
+    with zipfile.ZipFile(path, "w") as z:
+        for i in range(2000):
+            z.writestr(f"{deep}{i}", b"")
+        z.writestr("/etc/evil", b"x")
+
+
+@case("nested_deep_extract", seconds=2.0, megabytes=8, expect="contain")
+def _nested_deep_extract(path: Path):
+    deep = "n/" * 120
+    with zipfile.ZipFile(path, "w") as z:
+        for i in range(200):
+            z.writestr(f"{deep}{i}.txt", b"x" * 100)
+
+
+@case("huge_declared_size", seconds=1.0, megabytes=8, expect="reject")
+def _huge_declared_size(path: Path):
+    local = _local_header("big", 0, 0, 0, zipfile.ZIP_STORED)
+    _raw_zip(path, local, [("big", 0, 0, 1, 2 ** 62, zipfile.ZIP_STORED)])
+
+
+@case("huge_declared_total", seconds=1.0, megabytes=8, expect="reject")
+def _huge_declared_total(path: Path):
+    # Each entry just under the per-file limit, the sum far over it; one byte of data each,
+    # laid out one after the other so only the size checks can catch it
+    size = au.MAX_EXTRACT_SIZE - 1
+    local, central = b"", []
+    for i in range(64):
+        central.append((f"p{i}", len(local), 0, 1, size, zipfile.ZIP_STORED))
+        local += _local_header(f"p{i}", 0, 1, 0, zipfile.ZIP_STORED) + b"x"
+    _raw_zip(path, local, central)
+
+
+@case("unicode_traversal", seconds=2.0, megabytes=8, expect="contain")
+def _unicode_traversal(path: Path):
+    # Characters that NFKC-normalize to "." or "/" (fullwidth, two dot leader, division slash...)
+    names = [
+        "．．/．．/evil1.txt",
+        "‥/evil2.txt",
+        "a／．．／．．／evil3.txt",
+        "․․∕evil4.txt",
+        "﹒﹒⧸evil5.txt",
+        ".̇./evil6.txt",
+        "․․⁄․․⁄evil7.txt",
+    ]
+    with zipfile.ZipFile(path, "w") as z:
+        for name in names:
+            z.writestr(name, b"x")
+
+
+@case("unicode_traversal_backslash", seconds=1.0, megabytes=8, expect="reject")
+def _unicode_traversal_backslash(path: Path):
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("ok.txt", b"x")
+        z.writestr("．．\\..\\evil.txt", b"x")
+
+
+# =========================
+# Runner
+# =========================
+
+def _escaped(sandbox: Path, dest: Path) -> list:
+    """Files written into the sandbox anywhere but the destination"""
+    return [
+        str(p) for p in sandbox.rglob("*")
+        if p != dest and p not in dest.parents and dest not in p.parents and p.name != "archive.zip"
+    ]
+
+
+def _attempt(archive: Path, dest: Path):
+    """Run safe_extract, returns (exception or None, seconds)"""
+    started = time.perf_counter()
+    try:
+        au.safe_extract(archive, dest)
+        error = None
+    except Exception as e:
+        error = e
+    return error, time.perf_counter() - started
+
+
+def run_case(name: str, build, seconds: float, megabytes: float, expect: str, workdir: Path) -> list:
+    """Returns the list of budget/behaviour violations (empty when the case passes)"""
+    sandbox = workdir / name
+    sandbox.mkdir()
+    archive = sandbox / "archive.zip"
+    build(archive)
+    # Nested so that a name climbing a few levels still lands inside the sandbox, where it is seen
+    dest = sandbox / "1" / "2" / "3" / "out"
+
+    # Timed without tracing (tracemalloc slows allocation-heavy code down several times)
+    error, elapsed = _attempt(archive, dest)
+    shutil.rmtree(dest, ignore_errors=True)
+    tracemalloc.start()
+    try:
+        _attempt(archive, dest)
+        peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+    problems = []
+    if expect == "reject" and error is None:
+        problems.append("accepted a hostile archive")
+    if expect == "contain" and error is not None and not isinstance(error, (RuntimeError, ValueError)):
+        problems.append(f"unexpected {type(error).__name__}: {error}")
+    escaped = _escaped(sandbox, dest)
+    if escaped:
+        problems.append(f"wrote outside the destination: {escaped[:3]}")
+    if elapsed > seconds:
+        problems.append(f"{elapsed:.2f}s over the {seconds:.1f}s budget")
+    if peak > megabytes:
+        problems.append(f"{peak:.1f} MB peak over the {megabytes:.0f} MB budget")
+    outcome = f"rejected ({type(error).__name__}: {error})" if error is not None else "extracted"
+    print(f"{'FAIL' if problems else 'ok  '} {name:<28} {elapsed:6.2f}s {peak:7.1f} MB  {outcome[:90]}")
+    for problem in problems:
+        print(f"       - {problem}")
+    return problems
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="Run hostile archives through safe_extract within time/memory budgets")
+    parser.add_argument("only", nargs="*", help="run only cases whose name contains one of these words")
+    parser.add_argument("--keep", metavar="DIR", help="keep the generated corpus and outputs in DIR")
+    args = parser.parse_args(argv)
+
+    # The rejections are expected, their log lines are noise here
+    logging.disable(logging.CRITICAL)
+    selected = [c for c in CASES if not args.only or any(word in c[0] for word in args.only)]
+    workdir = Path(args.keep) if args.keep else Path(tempfile.mkdtemp(prefix="hostile-"))
+    workdir.mkdir(parents=True, exist_ok=True)
+    # Keep checkpoints, manifests and the like out of the real install directory
+    state = workdir / "state"
+    au.CHECKPOINT_DIR = state / "checkpoints"
+    au.BATCH_CHECKPOINT_DIR = state / "batch_checkpoints"
+    au.MANIFEST_DIR = state / "manifests"
+    au.JOURNAL_FILE = state / "jobs.db"
+    au.READINESS_STATS_FILE = state / "readiness_stats.json"
+    try:
+        failed = [c[0] for c in selected if run_case(*c, workdir)]
+    finally:
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+    print(f"{len(selected) - len(failed)}/{len(selected)} cases within budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
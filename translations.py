@@ -6,6 +6,7 @@ Supports: French (fr), English (en)
 import json
 import logging
 import locale
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -21,112 +22,29 @@ DEFAULT_LANGUAGE = "en"
 # Get the directory where this file is located
 TRANSLATIONS_DIR = Path(__file__).resolve().parent
 LANGUAGE_CONFIG_FILE = Path(__file__).resolve().parent / "language_config.json"
+# One compact JSON catalog per language (locales/en.json, ...), loaded on first use
+LOCALES_DIR = TRANSLATIONS_DIR / "locales"
+
+_catalogs = {}
+_catalogs_lock = threading.Lock()
 
-# Translations dictionary
-TRANSLATIONS = {
-    "en": {
-        # General
-        "app_name": "Auto Unzip",
-        "already_installed": "Already installed.",
-        "installation_error": "Installation error",
-        "uninstallation_error": "Uninstallation error",
-        
-        # Installation messages
-        "select_language": "Select Language",
-        "choose_language_message": "Please choose your preferred language",
-        "installed_success": "Installed, will start automatically.",
-        "install_requires_exe": "Install mode requires a packaged executable (.exe).",
-        "install_error_detail": "Auto Unzip: installation error",
-        
-        # Uninstallation messages
-        "uninstalling": "Uninstalling...",
-        "uninstall_requires_exe": "Uninstall mode requires a packaged executable (.exe).",
-        
-        # Update messages
-        "update_in_progress": "Updating...",
-        "update_installed": "Update installed.",
-        "update_scheduled": "Update scheduled (applied as soon as possible).",
-        "update_error": "Auto Unzip: update error",
-        "no_update_available": "Already installed, no update available.",
-        
-        # Watcher messages
-        "watch_started": "Monitoring started on Downloads folder.",
-        "watch_error_config": "Auto Unzip: configuration",
-        "watch_error_folder_not_found": "Folder not found",
-        
-        # Zip extraction messages
-        "zip_detected": "Zip file detected",
-        "zip_extracted_success": "Auto Unzip: success",
-        "zip_extracted_message": "Extracted",
-        "zip_open_downloads": "Open Downloads",
-        "zip_ignore": "Ignore",
-        "zip_invalid": "Auto Unzip: ZIP error",
-        "zip_invalid_message": "Invalid/corrupted ZIP",
-        "zip_error": "Auto Unzip: error",
-        "zip_error_locked": "ZIP not ready (timeout)",
-        "zip_error_extraction": "Error on",
-        
-        # Buttons
-        "open_downloads": "Open Downloads",
-        "open_log": "Open log",
-        "ignore": "Ignore",
-        
-        # Monitoring
-        "monitoring_started": "Monitoring started on %s",
-        "shutdown_requested": "Shutdown requested (update/uninstall).",
-    },
-    "fr": {
-        # General
-        "app_name": "Auto Unzip",
-        "already_installed": "Déjà installé.",
-        "installation_error": "Erreur d'installation",
-        "uninstallation_error": "Erreur de désinstallation",
-        
-        # Installation messages
-        "select_language": "Sélectionner la langue",
-        "choose_language_message": "Veuillez choisir votre langue préférée",
-        "installed_success": "Installé, démarrera automatiquement.",
-        "install_requires_exe": "Le mode install nécessite l'exécutable (.exe) packagé.",
-        "install_error_detail": "Auto Unzip : erreur d'installation",
-        
-        # Uninstallation messages
-        "uninstalling": "Désinstallation en cours...",
-        "uninstall_requires_exe": "Le mode uninstall nécessite l'exécutable (.exe) packagé.",
-        
-        # Update messages
-        "update_in_progress": "Mise à jour en cours...",
-        "update_installed": "Mise à jour installée.",
-        "update_scheduled": "Mise à jour planifiée (appliquée dès que possible).",
-        "update_error": "Auto Unzip : erreur de mise à jour",
-        "no_update_available": "Déjà installé, pas de mise à jour disponible.",
-        
-        # Watcher messages
-        "watch_started": "Surveillance démarrée sur le dossier Téléchargements.",
-        "watch_error_config": "Auto Unzip : configuration",
-        "watch_error_folder_not_found": "Dossier introuvable",
-        
-        # Zip extraction messages
-        "zip_detected": "Zip détecté",
-        "zip_extracted_success": "Auto Unzip : succès",
-        "zip_extracted_message": "Extrait",
-        "zip_open_downloads": "Ouvrir Téléchargements",
-        "zip_ignore": "Ignorer",
-        "zip_invalid": "Auto Unzip : erreur ZIP",
-        "zip_invalid_message": "Zip invalide/corrompu",
-        "zip_error": "Auto Unzip : erreur",
-        "zip_error_locked": "Zip pas prêt (timeout)",
-        "zip_error_extraction": "Erreur sur",
-        
-        # Buttons
-        "open_downloads": "Ouvrir Téléchargements",
-        "open_log": "Ouvrir le log",
-        "ignore": "Ignorer",
-        
-        # Monitoring
-        "monitoring_started": "Surveillance démarrée sur %s",
-        "shutdown_requested": "Arrêt demandé (mise à jour / désinstallation).",
-    },
-}
+
+def load_catalog(language: str) -> dict:
+    """Load (once) and return the catalog of a language, {} if it cannot be read"""
+    catalog = _catalogs.get(language)
+    if catalog is not None:
+        return catalog
+    with _catalogs_lock:
+        catalog = _catalogs.get(language)
+        if catalog is None:
+            try:
+                with open(LOCALES_DIR / f"{language}.json", "r", encoding="utf-8") as f:
+                    catalog = json.load(f)
+            except Exception as e:
+                logging.error(f"Failed to load translations for {language}: {e}")
+                catalog = {}
+            _catalogs[language] = catalog
+    return catalog
 
 
 class Translator:
@@ -134,13 +52,16 @@ class Translator:
     
     def __init__(self, language: Optional[str] = None):
         self.language = language or self._load_saved_language() or self._detect_system_language()
-        if self.language not in TRANSLATIONS:
+        if self.language not in LANGUAGES:
             self.language = DEFAULT_LANGUAGE
+        load_catalog(self.language)
+        # Resolved argument-free messages (fallback already applied), reset on language change
+        self._messages = {}
     
     @staticmethod
     def _detect_system_language() -> str:
         """
-        Detect Windows system language and return appropriate language code.
+        Detect the system language and return appropriate language code.
         Maps Windows locale to supported languages.
         """
         try:
@@ -182,14 +103,22 @@ class Translator:
         except Exception as e:
             logging.error(f"Failed to save language config: {e}")
     
+    def _lookup(self, key: str) -> str:
+        text = self._messages.get(key)
+        if text is None:
+            catalog = load_catalog(self.language)
+            if key in catalog:
+                text = catalog[key]
+            else:
+                # Fallback to English if key not found
+                text = load_catalog(DEFAULT_LANGUAGE).get(key, f"[{key}]")
+                logging.warning(f"Missing translation key '{key}' for language {self.language}")
+            self._messages[key] = text
+        return text
+    
     def get(self, key: str, *args) -> str:
         """Get translated string with optional formatting"""
-        if key not in TRANSLATIONS[self.language]:
-            # Fallback to English if key not found
-            text = TRANSLATIONS[DEFAULT_LANGUAGE].get(key, f"[{key}]")
-            logging.warning(f"Missing translation key '{key}' for language {self.language}")
-        else:
-            text = TRANSLATIONS[self.language][key]
+        text = self._lookup(key)
         
         # Support formatting with arguments
         if args:
@@ -202,8 +131,9 @@ class Translator:
     
     def set_language(self, language: str):
         """Set the current language"""
-        if language in TRANSLATIONS:
+        if language in LANGUAGES:
             self.language = language
+            self._messages = {}
             self.save_language()
             logging.info(f"Language changed to: {language}")
         else:
@@ -212,14 +142,19 @@ class Translator:
 
 # Global translator instance
 _translator: Optional[Translator] = None
+_translator_lock = threading.Lock()
 
 
 def get_translator() -> Translator:
-    """Get the global translator instance"""
+    """Get the global translator instance (safe to call from any thread)"""
     global _translator
-    if _translator is None:
-        _translator = Translator()
-    return _translator
+    translator = _translator
+    if translator is None:
+        with _translator_lock:
+            if _translator is None:
+                _translator = Translator()
+            translator = _translator
+    return translator
 
 
 def set_global_language(language: str):